@@ -1,20 +1,25 @@
+from __future__ import annotations
+
 import secrets
+from functools import cache
 from utilities.dependencies import logger 
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from pathlib import Path
-from fastmcp.server.auth.providers.github import GitHubProvider
-
-# these imports down here are in plans to be implemented.
-# Redis Store for KeyValueStore interface from redis client and cryptography packets are needed
-# Same for Disk Storage, etc
-from utilities.storage import (
-    RedisStore,
-    DiskStore,
-    FernetEncryptionWrapper,
-)
 
 from config import settings
 
+# GitHubProvider and storage (cryptography, redis) are heavy to import
+# and not needed at all for --no-auth / stdio runs, so they are imported lazily below
+if TYPE_CHECKING:
+    from fastmcp.server.auth.providers.github import GitHubProvider
+
+
+@cache
+def _ephemeral_jwt_key() -> str:
+    # GitHubProvider validates the key as str (raw token_bytes are rejected),
+    # so the urlsafe form stays, but it's generated once per process
+    return secrets.token_urlsafe(32)
+
 
 def get_auth_provider() -> Optional[GitHubProvider]:
     """
@@ -30,6 +35,8 @@ def get_auth_provider() -> Optional[GitHubProvider]:
         logger.error("❌ Auth enabled but Client ID missing via .env or CLI.")
         return None
 
+    from fastmcp.server.auth.providers.github import GitHubProvider
+
     # checking for keys to decide on storage type (persistent or in-memory)
     #  and
     has_keys =  settings.STORAGE_ENCRYPTION_KEY
@@ -41,25 +48,44 @@ def get_auth_provider() -> Optional[GitHubProvider]:
         # production( with encryption and persistence) ===
         logger.info("🔒 Using PERSISTENT storage (Encrypted).")
 
+        from utilities.storage import (
+            RedisStore,
+            DiskStore,
+            AESGCMEncryptionWrapper,
+            FernetEncryptionWrapper,
+            decode_encryption_key,
+        )
+
         jwt_key = settings.JWT_SIGNING_KEY
 
         # (Redis or Disk)
         if settings.USE_REDIS:
             try:
                 logger.info(f"💾 Connecting to Redis at {settings.REDIS_HOST}...")
-                backend = RedisStore(host=settings.REDIS_HOST, port=settings.REDIS_PORT)
+                backend = RedisStore(
+                    host=settings.REDIS_HOST,
+                    port=settings.REDIS_PORT,
+                    max_connections=settings.REDIS_POOL_SIZE,
+                    socket_keepalive=settings.REDIS_SOCKET_KEEPALIVE,
+                )
             except Exception as e:
                 logger.error(f"❌ Redis failed: {e}. Fallback to Disk.")
-                backend = DiskStore(".fastmcp_storage")
+                backend = DiskStore(str(Path(settings.STORAGE_DIR) / "storage.json"))
         else:
-            # Local Disk
-            storage_path = Path(".fastmcp_storage")
-            storage_path.mkdir(exist_ok=True)
-    
-            backend = DiskStore(str(storage_path / "storage.json"))
+            # Local Disk (DiskStore creates the directory itself)
+            backend = DiskStore(str(Path(settings.STORAGE_DIR) / "storage.json"))
 
         # encrypting
-        client_storage = FernetEncryptionWrapper(backend, settings.STORAGE_ENCRYPTION_KEY)
+        # AES-GCM when key fits (32 bytes), otherwise Fernet as fallback
+        use_aesgcm = (
+            settings.STORAGE_CIPHER.lower() == "aesgcm"
+            and len(decode_encryption_key(settings.STORAGE_ENCRYPTION_KEY)) == 32
+        )
+        if use_aesgcm:
+            client_storage = AESGCMEncryptionWrapper(backend, settings.STORAGE_ENCRYPTION_KEY)
+        else:
+            logger.info("🔑 Using Fernet encryption for storage.")
+            client_storage = FernetEncryptionWrapper(backend, settings.STORAGE_ENCRYPTION_KEY)
 
     else:
         # for dev/demo or quick usage ===
@@ -70,7 +96,7 @@ def get_auth_provider() -> Optional[GitHubProvider]:
 
         # temporary key that lives only in memory
         # (not saved anywhere, so it will be different on each restart)
-        jwt_key = secrets.token_urlsafe(32)
+        jwt_key = _ephemeral_jwt_key()
 
         # using in-memory storage( no point in encrypting therefore)
         client_storage = None
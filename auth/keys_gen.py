@@ -1,11 +1,13 @@
-from cryptography.fernet import Fernet
+import base64
 import secrets
-# here you can generate a random JWT signing key and a Fernet key for encryption. 
+# here you can generate a random JWT signing key and a storage encryption key.
+# The storage key is 32 random bytes (urlsafe base64): used for AES-256-GCM, and it's a valid Fernet key too,
+# so it also works with STORAGE_CIPHER=fernet.
 # You can run this script and copy the output into your .env file.
 jwt_key = secrets.token_urlsafe(32)
 
-fernet_key = Fernet.generate_key().decode()
+storage_key = base64.urlsafe_b64encode(secrets.token_bytes(32)).decode()
 
 print("Copy this into your .env file:\n")
 print(f"JWT_SIGNING_KEY={jwt_key}")
-print(f"STORAGE_ENCRYPTION_KEY={fernet_key}")
\ No newline at end of file
+print(f"STORAGE_ENCRYPTION_KEY={storage_key}")
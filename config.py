@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -25,9 +26,15 @@ class Settings(BaseSettings):
     # turns out github jwt keys are opaque,so they verify them by calling GitHub's API
     JWT_SIGNING_KEY: Optional[str] = None
     STORAGE_ENCRYPTION_KEY: Optional[str] = None
+    # "aesgcm" (default, needs 32-byte key, still reads values stored with fernet) or "fernet" (keeps writing the old format)
+    STORAGE_CIPHER: str = "aesgcm"
+    # directory for the encrypted disk store (storage.json is created inside)
+    STORAGE_DIR: str = ".fastmcp_storage"
     USE_REDIS: bool = False
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
+    REDIS_POOL_SIZE: int = 32
+    REDIS_SOCKET_KEEPALIVE: bool = True
 
     # --- Filesystem Config ---
     ALLOWED_ROOTS: List[Path] = Field(default_factory=list)
@@ -36,6 +43,12 @@ class Settings(BaseSettings):
         description="Allow access to current working directory if no roots specified"
     )
     DOWNLOAD_DIR: str = "./for_download"
+    # threads for blocking filesystem calls, mostly waiting on IO, so more than CPU count is fine
+    FS_WORKERS: int = 32
+    # seconds to reuse roots fetched from a client before asking it again
+    CLIENT_ROOTS_TTL: float = 2.0
+    # seconds to reuse a resolved (realpath) form of a path
+    PATH_CACHE_TTL: float = 2.0
 
     # RECURSIVE: bool = Field(
     #     default=True,
@@ -43,10 +56,16 @@ class Settings(BaseSettings):
     # )
 
     model_config = SettingsConfigDict(
-        env_file=".env", 
+        # don't make pydantic look for .env on every start when there is none
+        env_file=".env" if Path(".env").exists() else None,
         env_file_encoding="utf-8",
         extra="ignore"
     )
     
-settings = Settings()    
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build settings once per process, every later call returns the same (mutable) instance."""
+    return Settings()
+
+settings = get_settings()
 
@@ -1,4 +1,6 @@
-from argparse import ArgumentParser
+import sys
+from functools import lru_cache, partial
+import anyio
 from pathlib import Path
 from fastmcp import FastMCP
 from auth.auth import get_auth_provider
@@ -12,8 +14,11 @@ from starlette.middleware.cors import CORSMiddleware
 from utilities.logging import initialize_logging
 
 
-def parse_command_line_args():
-    """Parse command line arguments for MCP server configuration."""
+@lru_cache(maxsize=1)
+def build_parser():
+    """Build the argument parser once (argparse is imported only when there are args to parse)."""
+    from argparse import ArgumentParser
+
     parser = ArgumentParser(
         description="MCP Filesystem Server",
         epilog="Example: python main.py /path/to/dir1 /path/to/dir2 --allow-cwd --transport sse/http",
@@ -74,15 +79,55 @@ def parse_command_line_args():
         help="Use Redis instead of Disk (requires --persist)",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def event_loop_options() -> dict:
+    """anyio backend options with a faster event loop (uvloop / winloop on Windows) if it's installed."""
+    try:
+        if sys.platform == "win32":
+            import winloop
+            return {"loop_factory": winloop.new_event_loop}
+        import uvloop
+        return {"loop_factory": uvloop.new_event_loop}
+    except ImportError:
+        return {}
+
+
+def tool_serializer():
+    """orjson based serializer for structured tool results if orjson is installed, otherwise fastmcp's default."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    from pydantic_core import to_jsonable_python
+
+    def serialize(data) -> str:
+        # pydantic models and other types orjson doesn't know are converted the same way fastmcp does it
+        return orjson.dumps(
+            data,
+            default=lambda obj: to_jsonable_python(obj, fallback=str),
+            option=orjson.OPT_NON_STR_KEYS,
+        ).decode()
+
+    return serialize
+
+
+def parse_command_line_args():
+    """Parse command line arguments for MCP server configuration."""
+    # common case for stdio clients: no arguments, defaults from settings are used as is
+    if len(sys.argv) == 1:
+        return None
+
+    args = build_parser().parse_args()
     if args.roots:
-        valid_roots = [
-            dependencies.check_path(r, check_existence=True) for r in args.roots
-        ]
+        valid_roots = dependencies.check_paths(args.roots, check_existence=True)
         settings.ALLOWED_ROOTS.extend(valid_roots)
     if args.allow_cwd:
         settings.ALLOW_CWD = True
         settings.ALLOWED_ROOTS.append(Path.cwd())
+    # roots from .env, --roots and cwd may overlap; one pass, order kept
+    settings.ALLOWED_ROOTS[:] = dict.fromkeys(settings.ALLOWED_ROOTS)
 
     if args.transport:
         settings.TRANSPORT = args.transport
@@ -116,12 +161,14 @@ if __name__ == "__main__":
         name="Filesystem & Monitor",
         instructions="Secure filesystem access and system monitoring.",
         auth=auth_provider,
+        tool_serializer=tool_serializer(),
     )
     
     file_transfer.ft_register_routes(mcp)
     filesystem.register(mcp)
     server_management.register(mcp)
     monitoring.register(mcp)
+    dependencies.register_notifications(mcp)
 
     # for testing purposes
     import tests.systemmonitoring as systemmonitoring
@@ -146,9 +193,14 @@ if __name__ == "__main__":
     if settings.TRANSPORT != "stdio":
         dependencies.logger.info(f"Listening on {settings.MCP_HOST}:{settings.MCP_PORT}")
     # here it enters the loop
-    mcp.run(
-        transport=settings.TRANSPORT,
-        host=settings.MCP_HOST,
-        port=settings.MCP_PORT,
-        middleware=asgi_middlewares,
+    # same as mcp.run(), but lets us pick the event loop implementation
+    anyio.run(
+        partial(
+            mcp.run_async,
+            transport=settings.TRANSPORT,
+            host=settings.MCP_HOST,
+            port=settings.MCP_PORT,
+            middleware=asgi_middlewares,
+        ),
+        backend_options=event_loop_options(),
     )
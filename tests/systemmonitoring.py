@@ -1,5 +1,8 @@
+import asyncio
 import os
+import stat
 import sys
+import time
 import psutil
 from pathlib import Path
 from typing import List
@@ -43,16 +46,30 @@ async def validate_path(path_str: str, ctx: Context) -> Path:
 
     return target_path
 
+# мінімальний інтервал між вимірюваннями CPU (секунди), частіші виклики отримують останнє значення
+_MIN_INTERVAL = 0.5
+_cpu_cache = {"ts": 0.0, "val": 0.0}
+
+# interval=None не блокує: рахує завантаження з моменту попереднього виклику,
+# тому перший виклик тут лише запам'ятовує базову точку (сам по собі повертає 0.0)
+psutil.cpu_percent(interval=None)
+
 def get_cpu_usage() -> float:
     """
     [R1.1] Повертає поточне завантаження процесора у відсотках.
     """
+    now = time.monotonic()
+    if now - _cpu_cache["ts"] < _MIN_INTERVAL:
+        return _cpu_cache["val"]
     try:
-        # interval=1 забезпечує точність вимірювання (блокуючий виклик)
-        return psutil.cpu_percent(interval=1)
+        # середнє завантаження з попереднього виклику, без блокування на 1 секунду
+        value = psutil.cpu_percent(interval=None)
     except Exception as e:
         logger.error(f"Error getting CPU usage: {e}")
         return -1.0
+    _cpu_cache["ts"] = now
+    _cpu_cache["val"] = value
+    return value
     
 def get_memory_usage() -> dict:
     """Повертає інформацію про використання оперативної пам'яті."""
@@ -63,6 +80,41 @@ def get_memory_usage() -> dict:
         "percent": mem.percent
     }
 
+def get_system_stats() -> dict:
+    """
+    Повертає CPU та пам'ять одним викликом.
+    CPU береться з кешу get_cpu_usage (без блокуючого інтервалу), пам'ять - одне читання virtual_memory.
+    """
+    return {"cpu": get_cpu_usage(), "mem": get_memory_usage()}
+
+def _tail_bytes(path: Path, n: int, block: int = 65536) -> bytes:
+    """
+    Повертає останні n рядків файлу (bytes).
+    Файл читається блоками з кінця, поки не знайдеться більше n переносів рядка,
+    тому великі логи не читаються повністю.
+    """
+    chunks = []
+    newlines = 0
+    with open(path, 'rb') as f:
+        offset = os.fstat(f.fileno()).st_size
+        # n+1 переносів: перший (можливо обрізаний) рядок відкидається нижче
+        while offset > 0 and newlines <= n:
+            read_len = min(block, offset)
+            offset -= read_len
+            f.seek(offset)
+            chunk = f.read(read_len)
+            chunks.append(chunk)
+            newlines += chunk.count(b'\n')
+
+    data = b''.join(reversed(chunks))
+    return b'\n'.join(data.splitlines()[-n:]) if n > 0 else b''
+
+def _read_tail(path: Path, n: int) -> bytes:
+    """Один stat замість exists() + is_file(), потім tail. Виконується в окремому потоці."""
+    if not stat.S_ISREG(os.stat(path).st_mode):
+        raise IsADirectoryError(path)
+    return _tail_bytes(path, n)
+
 async def read_log_file(path: str, lines: int = 100, ctx: Context = None) -> str:
     """
     [R1.2] Читає останні N рядків з лог-файлу.
@@ -75,26 +127,20 @@ async def read_log_file(path: str, lines: int = 100, ctx: Context = None) -> str
         # (R1.3, R2.6)
         target_path = await validate_path(path, ctx)
 
-        if not target_path.exists():
-            return f"Error: File '{path}' not found." # R2.3 Reliability
-        
-        if not target_path.is_file():
-            return f"Error: '{path}' is not a file."
+        # (Test Case D_06)
+        if lines < 0:
+            return "Error: Lines count cannot be negative."
 
-        # (спрощена реалізація tail)
-        # поки що читання повного файлу + зріз
+        # tail: читаються лише останні блоки файлу, а не весь файл;
+        # дисковий I/O у потоці, щоб не блокувати event loop
         try:
-            content = target_path.read_text(encoding='utf-8', errors='replace')
-            all_lines = content.splitlines()
-            
-            # (Test Case D_06)
-            if lines < 0:
-                return "Error: Lines count cannot be negative."
-                
-            last_lines = all_lines[-lines:] if lines > 0 else []
-            
-            return "\n".join(last_lines)
+            data = await asyncio.to_thread(_read_tail, target_path, lines)
+            return data.decode('utf-8', errors='replace')
             
+        except FileNotFoundError:
+            return f"Error: File '{path}' not found." # R2.3 Reliability
+        except IsADirectoryError:
+            return f"Error: '{path}' is not a file."
         except Exception as read_err:
             return f"Error reading file content: {read_err}"
 
@@ -107,4 +153,5 @@ def register_tools(mcp):
     """Register all system monitoring tools with the MCP instance."""
     mcp.tool()(get_cpu_usage)
     mcp.tool()(get_memory_usage)
+    mcp.tool()(get_system_stats)
     mcp.tool()(read_log_file)
\ No newline at end of file
@@ -0,0 +1,97 @@
+import pytest
+import gc
+import logging
+from pathlib import Path
+from unittest.mock import MagicMock, AsyncMock
+from utilities import dependencies
+
+logger = logging.getLogger("test_dependencies")
+
+# --- Фікстури (Налаштування) ---
+
+class FakeSession:
+    """Сесія клієнта: лише прапорець підтримки roots"""
+    def __init__(self, roots: bool = True):
+        self.roots = roots
+
+    def check_client_capability(self, capability) -> bool:
+        return self.roots
+
+def make_ctx(session, *paths):
+    """Context, де list_roots повертає задані шляхи як file:// roots"""
+    ctx = MagicMock()
+    ctx.session = session
+    ctx.list_roots = AsyncMock(return_value=[MagicMock(uri=p.as_uri()) for p in paths])
+    return ctx
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    """Кеш roots не переноситься між тестами"""
+    dependencies.invalidate_roots_cache()
+    yield
+    dependencies.invalidate_roots_cache()
+
+# --- Тести кешу roots клієнта ---
+
+@pytest.mark.asyncio
+async def test_client_roots_cached_and_invalidated(tmp_path):
+    """У межах TTL клієнта не питають вдруге, після інвалідації - питають"""
+    ctx = make_ctx(FakeSession(), tmp_path)
+    
+    first = await dependencies.fetch_roots_from_client(ctx)
+    second = await dependencies.fetch_roots_from_client(ctx)
+    assert first == second == [tmp_path.resolve()], f"Невірні roots: {first}, {second}"
+    assert ctx.list_roots.await_count == 1, "Повторний виклик у межах TTL мав узяти roots з кешу"
+    
+    dependencies.invalidate_client_roots(ctx.session)
+    await dependencies.fetch_roots_from_client(ctx)
+    # так само, як після add_allowed_root / remove_root
+    dependencies.invalidate_roots_cache()
+    await dependencies.fetch_roots_from_client(ctx)
+    logger.info("client_roots_cached: list_roots calls=%s", ctx.list_roots.await_count)
+    assert ctx.list_roots.await_count == 3, "Після інвалідації roots мали бути запитані знову"
+
+@pytest.mark.asyncio
+async def test_client_roots_not_shared_between_sessions(tmp_path):
+    """Закрита сесія не лишає свої roots у кеші, а сесія без roots capability їх не отримує"""
+    session_a = FakeSession()
+    await dependencies.fetch_roots_from_client(make_ctx(session_a, tmp_path))
+    assert len(dependencies._CLIENT_ROOTS_CACHE) == 1
+    
+    del session_a
+    gc.collect()
+    logger.info("client_roots_sessions: cache size after gc=%s", len(dependencies._CLIENT_ROOTS_CACHE))
+    assert len(dependencies._CLIENT_ROOTS_CACHE) == 0, "Запис закритої сесії залишився в кеші"
+    
+    ctx_b = make_ctx(FakeSession(roots=False))
+    assert await dependencies.fetch_roots_from_client(ctx_b) is None, "Сесія без roots capability отримала roots"
+    assert await dependencies.withinAllowed(tmp_path / "file.txt", ctx_b) is False, "Шлях з roots іншої сесії дозволено"
+
+# --- Тести is_within_roots (bisect по відсортованих префіксах) ---
+
+def test_within_roots_sibling_prefixes(tmp_path):
+    """/a не покриває /ab чи /a-b, хоча рядок "/a" є їх префіксом"""
+    roots = [tmp_path / "a", tmp_path / "a-b"]
+    
+    assert dependencies.is_within_roots(tmp_path / "a" / "file.txt", roots)
+    assert dependencies.is_within_roots(tmp_path / "a-b" / "file.txt", roots)
+    assert not dependencies.is_within_roots(tmp_path / "ab" / "file.txt", roots), "/ab прийнято як шлях у /a"
+    assert not dependencies.is_within_roots(tmp_path / "a-c" / "file.txt", roots), "/a-c прийнято як шлях у /a-b"
+    assert not dependencies.is_within_roots(tmp_path, roots), "Батьківська папка кореня прийнята"
+
+def test_within_roots_nested_roots(tmp_path):
+    """Вкладені корені не ламають пошук для інших коренів"""
+    roots = [tmp_path / "a" / "b", tmp_path / "c", tmp_path / "a"]
+    
+    for inside in ("a/x.txt", "a/b/x.txt", "a/bb/x.txt", "c/x.txt"):
+        assert dependencies.is_within_roots(tmp_path / inside, roots), f"{inside} мав бути дозволений"
+    for outside in ("b/x.txt", "cc/x.txt", "x.txt"):
+        assert not dependencies.is_within_roots(tmp_path / outside, roots), f"{outside} не мав бути дозволений"
+
+def test_within_roots_filesystem_root_and_root_itself(tmp_path):
+    """Корінь файлової системи покриває все, а сам корінь вважається всередині себе"""
+    anchor = Path(tmp_path.anchor)
+    
+    assert dependencies.is_within_roots(tmp_path / "x.txt", [anchor]), "Корінь ФС мав покривати будь-який шлях"
+    assert dependencies.is_within_roots(anchor, [anchor]), "Корінь ФС мав покривати сам себе"
+    assert dependencies.is_within_roots(tmp_path / "a", [tmp_path / "a"]), "Шлях, що дорівнює кореню, не прийнято"
@@ -0,0 +1,71 @@
+import pytest
+import os
+import logging
+from pathlib import Path
+from tools.filesystem import _glob_matches
+
+logger = logging.getLogger("test_filesystem")
+
+# --- Фікстури (Налаштування) ---
+
+@pytest.fixture
+def tree(tmp_path):
+    """
+    Дерево для пошуку:
+    root/a.py, root/notes.txt, root/src/b.py, root/src/deep/c.py,
+    root/node_modules/d.py, root/other/src/e.py
+    """
+    root = tmp_path / "root"
+    for rel in ("a.py", "notes.txt", "src/b.py", "src/deep/c.py", "node_modules/d.py", "other/src/e.py"):
+        file = root / rel
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text("x")
+    return root
+
+def rel_matches(root: Path, pattern: str, exclude=None, roots=None) -> list[str]:
+    """Результат _glob_matches як відсортовані відносні шляхи з '/'"""
+    matches = _glob_matches(root, pattern, exclude or [], roots)
+    return sorted(Path(m).relative_to(root).as_posix() for m in matches)
+
+# --- Тести search_files (_glob_matches) ---
+
+def test_glob_top_level_suffix(tree):
+    """'*.ext' шукає лише у самій папці"""
+    result = rel_matches(tree, "*.py")
+    logger.info("glob_top_level: %s", result)
+    assert result == ["a.py"], f"Невірний результат: {result}"
+
+def test_glob_recursive_suffix(tree):
+    """'**/*.ext' шукає на будь-якій глибині"""
+    result = rel_matches(tree, "**/*.py")
+    logger.info("glob_recursive: %s", result)
+    assert result == ["a.py", "node_modules/d.py", "other/src/e.py", "src/b.py", "src/deep/c.py"], f"Невірний результат: {result}"
+
+def test_glob_recursive_under_dir(tree):
+    """'dir/**/*.ext' шукає лише всередині dir (на будь-якій глибині), а не в інших папках з такою назвою"""
+    result = rel_matches(tree, "src/**/*.py")
+    logger.info("glob_under_dir: %s", result)
+    assert result == ["src/b.py", "src/deep/c.py"], f"Невірний результат: {result}"
+
+def test_glob_excluded_directory_pruned(tree):
+    """Виключена папка пропускається разом з усім вмістом"""
+    result = rel_matches(tree, "**/*.py", exclude=["node_modules", "deep"])
+    logger.info("glob_exclude: %s", result)
+    assert result == ["a.py", "other/src/e.py", "src/b.py"], f"Невірний результат: {result}"
+
+@pytest.mark.skipif(os.name == "nt", reason="symlink потребує прав адміністратора на Windows")
+def test_glob_symlinked_directories(tree, tmp_path):
+    """Як Path.glob: '*/...' проходить через symlink на папку в межах roots, '**' - ні; поза roots - ніколи"""
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "f.py").write_text("x")
+    (tree / "linksrc").symlink_to(tree / "src", target_is_directory=True)
+    (tree / "linkout").symlink_to(outside, target_is_directory=True)
+    
+    single_level = rel_matches(tree, "*/*.py", roots=[tree])
+    recursive = rel_matches(tree, "**/*.py", roots=[tree])
+    logger.info("glob_symlinks: single=%s recursive=%s", single_level, recursive)
+    
+    assert "linksrc/b.py" in single_level, f"symlink всередині roots пропущено: {single_level}"
+    assert "linkout/f.py" not in single_level, f"symlink поза roots пройдено: {single_level}"
+    assert not any(m.startswith("link") for m in recursive), f"'**' пройшов через symlink: {recursive}"
@@ -58,12 +58,14 @@ async def test_integration_read_empty_file(docker_env_setup):
 def test_integration_psutil_real(mocker):
     # Spy дозволяє виконати реальний код, але відстежити параметри виклику
     spy_cpu = mocker.spy(psutil, 'cpu_percent')
+    # скидаємо кеш, щоб виклик дійшов до psutil
+    systemmonitoring._cpu_cache.update(ts=0.0, val=0.0)
     
     result = systemmonitoring.get_cpu_usage()
     
     assert isinstance(result, float)
     assert 0.0 <= result <= 100.0
-    # Перевіряємо, чи дотримано контракт (interval=1 критичний для точності)
-    spy_cpu.assert_called_once_with(interval=1)
+    # Перевіряємо, чи дотримано контракт (неблокуючий виклик, база задана при імпорті модуля)
+    spy_cpu.assert_called_once_with(interval=None)
 
     
@@ -0,0 +1,71 @@
+import pytest
+import logging
+from cryptography.fernet import Fernet
+from utilities.storage import DiskStore, AESGCMEncryptionWrapper, FernetEncryptionWrapper
+
+logger = logging.getLogger("test_storage")
+
+# --- Фікстури (Налаштування) ---
+
+@pytest.fixture
+def key():
+    """Ключ у форматі auth/keys_gen.py (32 байти, urlsafe base64)"""
+    return Fernet.generate_key().decode()
+
+@pytest.fixture
+def backend(tmp_path):
+    """Справжнє дискове сховище в тимчасовій папці"""
+    return DiskStore(str(tmp_path / "storage.json"))
+
+# --- Тести AES-GCM ---
+
+@pytest.mark.asyncio
+async def test_aesgcm_round_trip(backend, key):
+    """Записане значення читається назад, а на диску лежить лише шифротекст"""
+    storage = AESGCMEncryptionWrapper(backend, key)
+    value = {"access_token": "gho_secret", "expires_in": 3600}
+    
+    await storage.put("tok", value, collection="tokens")
+    raw = await backend.get("tok", collection="tokens")
+    result = await storage.get("tok", collection="tokens")
+    logger.info("aesgcm_round_trip: raw=%s result=%s", raw, result)
+    
+    assert result == value, f"Значення змінилось після шифрування: {result}"
+    assert "gho_secret" not in raw, "Відкритий текст потрапив у сховище"
+
+@pytest.mark.asyncio
+async def test_aesgcm_rejects_tampering(backend, key):
+    """Змінений шифротекст або значення, перенесене на інший ключ, не розшифровуються"""
+    storage = AESGCMEncryptionWrapper(backend, key)
+    await storage.put("a", "value-a")
+    await storage.put("b", "value-b")
+    raw = await backend.get("a")
+    
+    # змінюємо один символ у base64 шифротексту
+    flipped = raw[:20] + ("A" if raw[20] != "A" else "B") + raw[21:]
+    await backend.put("a", flipped)
+    tampered = await storage.get("a")
+    
+    # aad прив'язує значення до ключа, тому копія "b" під ключем "a" не читається
+    await backend.put("a", await backend.get("b"))
+    swapped = await storage.get("a")
+    logger.info("aesgcm_tampering: tampered=%s swapped=%s", tampered, swapped)
+    
+    assert tampered is None, f"Змінений шифротекст прийнято: {tampered}"
+    assert swapped is None, f"Значення іншого ключа прийнято: {swapped}"
+
+@pytest.mark.asyncio
+async def test_aesgcm_reads_legacy_fernet(backend, key):
+    """Значення, записані Fernet старими версіями, читаються і перешифровуються при наступному записі"""
+    await FernetEncryptionWrapper(backend, key).put("tok", {"login": "old"})
+    storage = AESGCMEncryptionWrapper(backend, key)
+    
+    legacy = await storage.get("tok")
+    await storage.put("tok", legacy)
+    raw = await backend.get("tok")
+    logger.info("aesgcm_legacy: legacy=%s raw=%s", legacy, raw)
+    
+    assert legacy == {"login": "old"}, f"Старе значення не прочитано: {legacy}"
+    assert await storage.get("tok") == {"login": "old"}, "Значення втрачено після перезапису"
+    # після запису це вже AES-GCM, Fernet його не розшифрує
+    assert await FernetEncryptionWrapper(backend, key).get("tok") is None, "Значення залишилось у форматі Fernet"
@@ -29,6 +29,8 @@ def setup_module(mock_deps):
     """Ініціалізуємо модуль перед кожним тестом"""
     logger, norm_path, within_allowed = mock_deps
     systemmonitoring._init_systemmonitoring(logger, norm_path, within_allowed)
+    # кеш CPU не переноситься між тестами
+    systemmonitoring._cpu_cache.update(ts=0.0, val=0.0)
     return logger, norm_path, within_allowed
 
 # --- Тести CPU (R1.1) ---
@@ -49,8 +51,21 @@ def test_get_cpu_usage_valid(mock_cpu):
     assert isinstance(result, float), f"Очікував float, отримав {type(result)} зі значенням {result}"
     # Перевірка діапазону (логічна перевірка)
     assert 0.0 <= result <= 100.0, f"CPU % поза межами 0..100: {result}"
-    # Перевірка правильності виклику бібліотеки
-    mock_cpu.assert_called_with(interval=1)
+    # Перевірка правильності виклику бібліотеки (неблокуючий виклик)
+    mock_cpu.assert_called_with(interval=None)
+
+@patch('psutil.cpu_percent')
+def test_get_cpu_usage_cached(mock_cpu):
+    """Повторний виклик у межах _MIN_INTERVAL повертає кешоване значення без psutil"""
+    mock_cpu.return_value = 42.5
+    
+    first = systemmonitoring.get_cpu_usage()
+    mock_cpu.return_value = 99.0
+    second = systemmonitoring.get_cpu_usage()
+    logger.info("cpu_usage_cached: first=%s second=%s", first, second)
+    
+    assert first == second == 42.5, f"Очікували кешоване значення, отримали {first}, {second}"
+    mock_cpu.assert_called_once_with(interval=None)
 
 @patch('psutil.cpu_percent')
 def test_get_cpu_usage_error(mock_cpu, setup_module):
@@ -66,6 +81,20 @@ def test_get_cpu_usage_error(mock_cpu, setup_module):
     # Перевіряємо, що помилка була залогована
     logger.error.assert_called_once()
 
+@patch('psutil.virtual_memory')
+@patch('psutil.cpu_percent')
+def test_get_system_stats(mock_cpu, mock_mem):
+    """CPU і пам'ять одним викликом: по одному зверненню до psutil"""
+    mock_cpu.return_value = 10.0
+    mock_mem.return_value = MagicMock(total=8 * 1024**3, available=2 * 1024**3, percent=75.0)
+
+    result = systemmonitoring.get_system_stats()
+    logger.info("system_stats: result=%s", result)
+
+    assert result == {"cpu": 10.0, "mem": {"total_gb": 8.0, "available_gb": 2.0, "percent": 75.0}}, f"Невірний результат: {result}"
+    mock_cpu.assert_called_once_with(interval=None)
+    mock_mem.assert_called_once()
+
 # --- Тести безпеки шляхів (Async) (R1.3, R2.6) ---
 
 @pytest.mark.asyncio
@@ -112,34 +141,42 @@ async def test_validate_path_sensitive_extension(setup_module):
 # --- Тести читання логів (R1.2, R2.3) ---
 
 @pytest.mark.asyncio
-async def test_read_log_file_success(setup_module):
+async def test_read_log_file_success(setup_module, tmp_path):
     """Тест успішного читання файлу"""
     mock_ctx = MagicMock()
     
-    # імітуємо методи Path всередині systemmonitoring
-    # оскільки ми не можемо легко зімітувати об'єкт Path, створений всередині функції,
-    # то будемо мокати системні виклики через patch
+    # tail читає файл з диска блоками з кінця, тому тут справжній тимчасовий файл
+    log_file = tmp_path / "test.log"
+    log_file.write_bytes(b"Line 1\nLine 2\nLine 3")
     
-    with patch('pathlib.Path.exists', return_value=True), \
-         patch('pathlib.Path.is_file', return_value=True), \
-         patch('pathlib.Path.read_text', return_value="Line 1\nLine 2\nLine 3"):
-        
-        result = await systemmonitoring.read_log_file("/tmp/test.log", lines=2, ctx=mock_ctx)
-        logger.info("read_log_success: result=%s", result)
-        
-        assert result == "Line 2\nLine 3", f"Невірний зріз рядків: {result}"
+    result = await systemmonitoring.read_log_file(str(log_file), lines=2, ctx=mock_ctx)
+    logger.info("read_log_success: result=%s", result)
+    
+    assert result == "Line 2\nLine 3", f"Невірний зріз рядків: {result}"
+
+def test_tail_bytes_multiple_blocks(tmp_path):
+    """tail через кілька блоків дає той самий результат, що й повне читання + splitlines"""
+    log_file = tmp_path / "big.log"
+    content = b"".join(b"line %d\r\n" % i for i in range(1000))
+    log_file.write_bytes(content)
+    
+    for n in (0, 1, 5, 999, 1000, 2000):
+        # маленький блок, щоб рядки розрізались на межах блоків
+        result = systemmonitoring._tail_bytes(log_file, n, block=7)
+        expected = b"\n".join(content.splitlines()[-n:]) if n else b""
+        assert result == expected, f"n={n}: {result[:50]!r}"
 
 @pytest.mark.asyncio
-async def test_read_log_file_not_found():
+async def test_read_log_file_not_found(tmp_path):
     """Тест R2.3: Файл не знайдено (Reliability)"""
     mock_ctx = MagicMock()
     
-    with patch('pathlib.Path.exists', return_value=False):
-        result = await systemmonitoring.read_log_file("/tmp/missing.log", ctx=mock_ctx)
-        logger.info("read_log_not_found: result=%s", result)
-        
-        assert "Error: File" in result, "Очікувано повідомлення про відсутній файл"
-        assert "not found" in result, f"Отримано інше повідомлення: {result}"
+    # існування перевіряється одним os.stat, тому просто шлях, якого немає
+    result = await systemmonitoring.read_log_file(str(tmp_path / "missing.log"), ctx=mock_ctx)
+    logger.info("read_log_not_found: result=%s", result)
+    
+    assert "Error: File" in result, "Очікувано повідомлення про відсутній файл"
+    assert "not found" in result, f"Отримано інше повідомлення: {result}"
 
 @pytest.mark.asyncio
 async def test_read_log_negative_lines():
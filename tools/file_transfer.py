@@ -1,4 +1,6 @@
+import asyncio
 import os
+import stat
 from fastmcp import FastMCP,Context
 from starlette.requests import Request
 from starlette.responses import Response, JSONResponse, FileResponse, HTMLResponse
@@ -6,29 +8,64 @@ from config import settings
 from utilities import dependencies
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# resolved once, the download dir doesn't change while the server runs
+_DOWNLOAD_ROOT = Path(settings.DOWNLOAD_DIR).resolve()
+# copies into the download dir that are still running, by destination
+_inflight: dict[Path, asyncio.Future] = {}
+
 def ensure_download_dir():
     if not os.path.exists(settings.DOWNLOAD_DIR):
         os.makedirs(settings.DOWNLOAD_DIR)
         return True
     return False
 
+def _clone_or_copy(source: Path, destination: Path):
+    """
+    Copies the file into the download dir as a reflink (copy-on-write clone) where the filesystem supports it
+    (btrfs, xfs, ...), with a regular copy otherwise. Never a hardlink: the download must stay a snapshot,
+    later edits of the source must not show up on /files and the download must not alias the user's file.
+    """
+    import shutil
+    ficlone = getattr(fcntl, "FICLONE", None)
+    if ficlone is not None:
+        try:
+            with open(source, "rb") as src, open(destination, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), ficlone, src.fileno())
+            return
+        except OSError:
+            # other filesystem or no reflink support, the copy below overwrites what was created
+            pass
+    # copyfile uses copy_file_range/sendfile where available, mtime and permissions aren't needed for downloads
+    shutil.copyfile(source, destination)
+
 async def prepare_file_for_download(file_path: str, ctx: Context) -> Path:
     '''
     Prepares a file for download by copying it to the server's designated download directory.
     Validates the file path against allowed roots and checks for existence before copying.
     User can then access the file via the /files/{filename} endpoint.
     '''
-    import shutil
     try:
         file_path: Path = await dependencies.validate_path(file_path, ctx, must_exist=True, expected_type='file')
     except ValueError as e:
         dependencies.logger.error(f"File {file_path} is not valid or accessible or not within allowed roots: {e}")
         raise
 
-    destination = os.path.join(Path(settings.DOWNLOAD_DIR).resolve(), file_path.name)
+    destination = _DOWNLOAD_ROOT / file_path.name
+    # concurrent requests for the same file wait for the copy that is already running
+    copying = _inflight.get(destination)
     # check if destination file already exists in the download directory
-    if not os.path.exists(destination):
-        shutil.copy2(file_path, destination)
+    if copying is None and dependencies.stat_or_none(destination) is None:
+        copying = asyncio.ensure_future(dependencies.run_blocking(_clone_or_copy, file_path, destination))
+        _inflight[destination] = copying
+        copying.add_done_callback(lambda _: _inflight.pop(destination, None))
+    if copying is not None:
+        # shielded, so a cancelled caller doesn't cancel the copy for the others
+        await asyncio.shield(copying)
 
     return f"File {file_path.name} prepared for download. Access it at http://{settings.MCP_HOST}:{settings.MCP_PORT}/files/{file_path.name}"
 
@@ -39,29 +76,33 @@ def ft_register_routes(mcp: FastMCP):
 
     async def download_file(request: Request) -> Response:
         filename = request.path_params["filename"]
-        file_path = os.path.join(settings.DOWNLOAD_DIR, filename)
+        file_path = _DOWNLOAD_ROOT / filename
         dependencies.logger.info(f"Received download request for file: {filename}")
         try:
             file_path: Path = dependencies.check_path(file_path, check_existence=True)
-            if file_path.is_file():
+            # the same stat is handed to FileResponse, so it doesn't stat the file again before sending
+            st = dependencies.stat_or_none(file_path)
+            if st is not None and stat.S_ISREG(st.st_mode):
                 dependencies.logger.info(f"File {filename} is valid and ready for download.")
-                return FileResponse(file_path, media_type='application/octet-stream', filename=filename)
+                return FileResponse(file_path, media_type='application/octet-stream', filename=filename, stat_result=st)
         except ValueError as e:
             dependencies.logger.warning(f"File {filename} is not valid or accessible: {e}")
-            return JSONResponse({"status": "error", "message": f"File {filename} is not accessible or does not exist."})
+        return JSONResponse({"status": "error", "message": f"File {filename} is not accessible or does not exist."})
         
     async def list_files(request: Request) -> Response:
         # list with html tags
         files = []
         try:
-            files = os.listdir(settings.DOWNLOAD_DIR)
-            for idx, file in enumerate(files):
-                file_path = os.path.join(settings.DOWNLOAD_DIR, file)
-                try:
-                    file_size = os.path.getsize(file_path)
-                    files[idx] = f"<li><a href='/files/{file}'>{file}</a>({file_size} bytes)</li>"
-                except OSError:
-                    files[idx] = f"<li><a href='/files/{file}'>{file}</a>(unknown size)</li>"
+            # scandir entries carry the file type, so only the size needs a stat
+            with os.scandir(_DOWNLOAD_ROOT) as it:
+                for entry in it:
+                    try:
+                        if not entry.is_file():
+                            continue
+                        file_size = entry.stat().st_size
+                        files.append(f"<li><a href='/files/{entry.name}'>{entry.name}</a>({file_size} bytes)</li>")
+                    except OSError:
+                        files.append(f"<li><a href='/files/{entry.name}'>{entry.name}</a>(unknown size)</li>")
         except Exception as e:
             dependencies.logger.error(f"Error listing files in download directory: {e}")
             return JSONResponse({"status": "error", "message": "Could not list files."})
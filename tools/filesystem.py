@@ -1,23 +1,57 @@
 from pathlib import Path
+import asyncio
+import codecs
+import glob
+import mmap
+import re
 import shutil
+import stat
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
 from fastmcp import Context
 from utilities import dependencies
-from typing import List
+from typing import List, Optional
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, partial
+from operator import itemgetter
 from utilities.filereader import FileReader
 from utilities.imagereader import ImageReader
 
+# duplicate detection only needs a fast, well distributed hash, not a cryptographic one
+try:
+    import xxhash
+    _content_hash = xxhash.xxh3_128
+except ImportError:
+    import hashlib
+    # sha256 has hardware support (SHA-NI / ARMv8 crypto) on most current CPUs,
+    # which makes it faster than md5/blake2 from hashlib there
+    _content_hash = hashlib.sha256
+
+def _scan_entries(target_path: Path) -> list[tuple[bool, str, str]]:
+    """(is_file, casefolded name, name) for every entry of a directory."""
+    with os.scandir(target_path) as it:
+        # is_dir() uses d_type from readdir, stat is only needed for symlinks
+        return [(not entry.is_dir(), entry.name.casefold(), entry.name) for entry in it]
+
 async def list_files(path: str, ctx: Context) -> str:
     """List files and directories at the given path."""
     try:
-        target_path = await dependencies.validate_path(path, ctx, must_exist=True, expected_type='dir')
-        
-        items = []
-        for item in target_path.iterdir():
-            prefix = "📁" if item.is_dir() else "📄"
-            items.append(f"{prefix} {item.name}")
-            
-        return "\n".join(sorted(items))
+        # existence/type are checked by scandir itself (one syscall instead of three)
+        target_path = await dependencies.validate_path(path, ctx, must_exist=False)
+
+        try:
+            entries = await dependencies.run_blocking(_scan_entries, target_path)
+        except FileNotFoundError:
+            raise ValueError(f"Error: Path '{target_path}' does not exist")
+        except NotADirectoryError:
+            raise ValueError(f"Error: Expected directory, but '{target_path.name}' is a file")
+
+        # directories first, then files, both by name (case-insensitive);
+        # plain tuple comparison, no key function called from Python
+        entries.sort()
+        return "\n".join(f"{'📄' if is_file else '📁'} {name}" for is_file, _, name in entries)
     except Exception as e:
         return f"Error: {str(e)}"
 
@@ -34,6 +68,8 @@ async def read_file(path: str, ctx: Context, include_images: bool = False):
         Also not every client supports sampling and not every model supports OCR/vision, therefore, if you need this tool, you should check those info beforehand.
     """
     try:
+        # one stat: missing paths, directories and special files (fifo would block a worker) are rejected
+        # before any reader runs, epub/rtf readers don't even open the path
         target_path = await dependencies.validate_path(path, ctx, must_exist=True, expected_type='file')
         
         reader = None
@@ -44,7 +80,8 @@ async def read_file(path: str, ctx: Context, include_images: bool = False):
                 ctx.info("Client does not support sampling, cannot include image descriptions.")
                 include_images = False
         
-        result = FileReader([target_path], include_images=include_images).read()
+        # parsing (pdf/docx) and disk reads are blocking, keep them off the event loop
+        result = await dependencies.run_blocking(FileReader([target_path], include_images=include_images).read)
         
         if result and len(result) > 0:
             file_data = result[0]
@@ -79,6 +116,24 @@ async def read_file(path: str, ctx: Context, include_images: bool = False):
     except Exception as e:
         return f"Error reading file: {str(e)}"
     
+def _write_text_file(target_path: Path, content: str) -> None:
+    # Create parent directories if they don't exist
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # encode once and write the bytes straight to the fd, no text/buffer layers in between
+    # (write_text translated "\n" to os.linesep, so that part is kept)
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+    data = memoryview(content.encode("utf-8"))
+    fd = os.open(target_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_CLOEXEC', 0), 0o666)
+    try:
+        while data:
+            # os.write may write less than asked for big buffers
+            written = os.write(fd, data)
+            data = data[written:]
+    finally:
+        os.close(fd)
+
 async def write_file(path: str, content: str, ctx: Context) -> str:
     try:
         # for writing we need to check the path without existence check, because we might be creating a new file or overwrite
@@ -86,10 +141,7 @@ async def write_file(path: str, content: str, ctx: Context) -> str:
 
         if not await dependencies.withinAllowed(target_path.parent, ctx):
              return f"Error: Access denied to write in '{target_path.parent}'"
-        # Create parent directories if they don't exist
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        target_path.write_text(content, encoding="utf-8")
+        await dependencies.run_blocking(_write_text_file, target_path, content)
         return f"Saved to {target_path}"
         
     except Exception as e:
@@ -101,11 +153,41 @@ async def create_directory(path: str, ctx: Context) -> str:
         target_path = await dependencies.validate_path(path, ctx, must_exist=False)
         if not await dependencies.withinAllowed(target_path.parent, ctx):
              return f"Error: Access denied to create directory in '{target_path.parent}'"    
-        target_path.mkdir(parents=True, exist_ok=True)
+        await dependencies.run_blocking(target_path.mkdir, parents=True, exist_ok=True)
         return f"Created directory '{path}'"
     except Exception as e:
         return f"Error: {str(e)}"
 
+def _scan_with_sizes(target_path: Path) -> tuple[list[tuple[str, str, bool, int]], int, int, int]:
+    """(casefolded name, name, is_dir, size) rows of a directory plus total size, file and directory counts."""
+    entries = []
+    total_size = 0
+    total_files = 0
+    total_dirs = 0
+    
+    # scandir gives the type from the directory read itself, only file sizes need a stat
+    with os.scandir(target_path) as it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+                # directory sizes aren't shown, so they are not stat'ed (0 when sorting by size)
+                size = 0 if is_dir else entry.stat().st_size
+            except OSError:
+                # Skip files we can't stat
+                continue
+            
+            if is_dir:
+                total_dirs += 1
+            else:
+                total_files += 1
+                total_size += size
+            
+            name = entry.name
+            # sort key is computed once here, not in a lambda during sorting
+            entries.append((name.casefold(), name, is_dir, size))
+
+    return entries, total_size, total_files, total_dirs
+
 async def list_directory_with_sizes(path: str, sort_by: str = "name", ctx: Context = None) -> str:
     """Get a detailed listing of files and directories with sizes.
     
@@ -116,322 +198,419 @@ async def list_directory_with_sizes(path: str, sort_by: str = "name", ctx: Conte
     try:
         target_path = await dependencies.validate_path(path, ctx, must_exist=True, expected_type='dir')
         
-        entries = []
-        total_size = 0
-        total_files = 0
-        total_dirs = 0
-        
-        for item in target_path.iterdir():
-            try:
-                stats = item.stat()
-                size = stats.st_size
-                is_dir = item.is_dir()
-                
-                if is_dir:
-                    total_dirs += 1
-                    size_str = ""
-                else:
-                    total_files += 1
-                    total_size += size
-                    size_str = dependencies.format_size(size)
-                
-                entries.append({
-                    'name': item.name,
-                    'is_dir': is_dir,
-                    'size': size,
-                    'size_str': size_str
-                })
-            except Exception:
-                # Skip files we can't stat
-                continue
+        entries, total_size, total_files, total_dirs = await dependencies.run_blocking(_scan_with_sizes, target_path)
         
         # Sort entries
         if sort_by == "size":
-            entries.sort(key=lambda x: x['size'], reverse=True)
+            entries.sort(key=itemgetter(3), reverse=True)
         else:
-            entries.sort(key=lambda x: x['name'].lower())
+            entries.sort(key=itemgetter(0))
         
-        # Format output
+        # Format output (templates are parsed once, not per entry)
+        dir_line = "📁 {:<30} ".format
+        file_line = "📄 {:<30} {:>10}".format
+        format_size = dependencies.format_size
         lines = [f"Contents of '{path}':\n"]
-        for entry in entries:
-            prefix = "📁" if entry['is_dir'] else "📄"
-            name = f"{entry['name']}/" if entry['is_dir'] else entry['name']
-            size = entry['size_str'].rjust(10) if entry['size_str'] else ""
-            lines.append(f"{prefix} {name:<30} {size}")
+        lines.extend(
+            dir_line(name + "/") if is_dir else file_line(name, format_size(size))
+            for _, name, is_dir, size in entries
+        )
         
         # Add summary
         lines.append("")
         lines.append(f"Total: {total_files} files, {total_dirs} directories")
-        lines.append(f"Combined size: {dependencies.format_size(total_size)}")
+        lines.append(f"Combined size: {format_size(total_size)}")
         
         return "\n".join(lines)
     
     except Exception as e:
         return f"Error: {str(e)}"
 
-async def analyze_directory_security(path: str, ctx: Context) -> str:
-    """
-    Provides comprehensive security and content analysis of a directory.
-    
-    Analyzes file types, potential security risks, content overview,
-    and provides intelligent assessment using AI sampling if available.
-    
-    Args:
-        path: Directory path to analyze
-        ctx: MCP context for security validation and AI capabilities
-    """
+_MMAP_THRESHOLD = 1 << 20
+_HASH_CHUNK_SIZE = 1 << 20
+
+def _hash_file(file_path: Path | str, file_size: int) -> str:
+    """Content hash for duplicate detection."""
+    # unbuffered: chunks go from the OS straight to the hash, no BufferedReader copy in between
+    with open(file_path, 'rb', buffering=0) as f:
+        if file_size >= _MMAP_THRESHOLD:
+            # hash straight from the page cache, no copy of the file into a bytes object
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return _content_hash(mm).hexdigest()
+            except (ValueError, OSError):
+                # e.g. some network filesystems can't be mapped, read it instead
+                pass
+        # read in 1 MiB chunks, memory per worker stays bounded whatever the file size
+        h = _content_hash()
+        for chunk in iter(partial(f.read, _HASH_CHUNK_SIZE), b''):
+            h.update(chunk)
+        return h.hexdigest()
+
+# Known suspicious extensions and patterns
+_SUSPICIOUS_EXTENSIONS = frozenset({'.exe', '.scr', '.bat', '.cmd', '.com', '.pif', '.vbs', '.ps1', '.jar', '.app', '.dmg'})
+_EXECUTABLE_EXTENSIONS = frozenset({'.exe', '.msi', '.deb', '.rpm', '.app', '.dmg', '.run', '.sh', '.bat', '.cmd', '.ps1'})
+_ARCHIVE_EXTENSIONS = frozenset({'.zip', '.rar', '.7z', '.tar', '.gz', '.bz2'})
+_SAMPLE_EXTENSIONS = frozenset({'.txt', '.py', '.js', '.html', '.css', '.md', '.json', '.xml', '.yml', '.yaml', '.log', '.cfg', '.ini'})
+# one pass over the lowercased filename instead of a substring check per pattern,
+# the lookahead doesn't consume the name, so overlapping words ("secretoken") are all found
+_SUSPICIOUS_NAME_RE = re.compile(r'(?=(password|key|token|secret|credential))')
+
+@cache
+def _ext_to_mime() -> dict[str, str]:
+    """Extension -> MIME type table, built once (mimetypes reads the system tables on init)."""
+    import mimetypes
+    mimetypes.init()
+    return dict(mimetypes.types_map)
+
+def _hash_or_none(file_path: str, file_size: int) -> Optional[str]:
+    """Content hash for duplicate detection, None if the file can't be read."""
     try:
-        import hashlib
-        import mimetypes
-        from datetime import datetime, timedelta
-        from collections import defaultdict
-        
-        target_path = await dependencies.validate_path(path, ctx, must_exist=True, expected_type='dir')
-        
-        # Enhanced data collection
-        file_types = {}
-        mime_types = defaultdict(int)
-        suspicious_files = []
-        executable_files = []
-        large_files = []
-        hidden_files = []
-        duplicate_files = defaultdict(list)  # hash -> [files]
-        recent_files = []  # Modified in last 7 days
-        old_files = []     # Not modified in last year
-        empty_files = []
-        
-        # Time analysis
-        now = datetime.now()
-        week_ago = now - timedelta(days=7)
-        year_ago = now - timedelta(days=365)
-        
-        # Directory structure analysis
-        depth_stats = defaultdict(int)
-        dir_file_counts = defaultdict(int)
-        
-        # Security patterns
-        suspicious_patterns = {
-            'password': [],
-            'key': [],
-            'token': [],
-            'secret': [],
-            'credential': []
-        }
-        
-        total_size = 0
-        total_files = 0
-        total_dirs = 0
-        sample_files = []
-        
-        # Known suspicious extensions and patterns
-        suspicious_extensions = {'.exe', '.scr', '.bat', '.cmd', '.com', '.pif', '.vbs', '.ps1', '.jar', '.app', '.dmg'}
-        executable_extensions = {'.exe', '.msi', '.deb', '.rpm', '.app', '.dmg', '.run', '.sh', '.bat', '.cmd', '.ps1'}
-        archive_extensions = {'.zip', '.rar', '.7z', '.tar', '.gz', '.bz2'}
-        
-        dependencies.logger.info(f"Starting comprehensive analysis of {target_path}")
-        
-        for root, dirs, files in os.walk(target_path):
-            current_depth = len(Path(root).relative_to(target_path).parts)
-            depth_stats[current_depth] += 1
-            total_dirs += len(dirs)
-            dir_file_counts[len(files)] += 1
-            
-            for file in files:
-                file_path = Path(root) / file
+        return _hash_file(file_path, file_size)
+    except Exception:
+        return None
+
+def _scan_security_tree(top: Path) -> tuple[list[tuple[str, str, os.stat_result]], dict, dict, int]:
+    """Walk the tree with scandir for analyze_directory_security.
+    Returns (files as (path, name, stat), depth_stats, dir_file_counts, total_dirs).
+    Counts match os.walk: directory symlinks are counted but not followed."""
+    files = []
+    depth_stats = defaultdict(int)
+    dir_file_counts = defaultdict(int)
+    total_dirs = 0
+    stack = [(os.fspath(top), 0)]
+
+    while stack:
+        dirpath, depth = stack.pop()
+        try:
+            it = os.scandir(dirpath)
+        except OSError:
+            # same as os.walk, unreadable directories are skipped
+            continue
+        subdirs = []
+        dir_files = 0
+        with it:
+            for entry in it:
                 try:
-                    file_stat = file_path.stat()
-                    file_size = file_stat.st_size
-                    total_size += file_size
-                    total_files += 1
-                    
-                    # Basic file analysis
-                    ext = file_path.suffix.lower()
-                    file_types[ext] = file_types.get(ext, 0) + 1
-                    
-                    # MIME type analysis
-                    mime_type, _ = mimetypes.guess_type(str(file_path))
-                    if mime_type:
-                        mime_types[mime_type] += 1
-                    
-                    # Time analysis
-                    mod_time = datetime.fromtimestamp(file_stat.st_mtime)
-                    if mod_time > week_ago:
-                        recent_files.append(f"{file_path.name} ({mod_time.strftime('%Y-%m-%d')})")
-                    elif mod_time < year_ago:
-                        old_files.append(f"{file_path.name} ({mod_time.strftime('%Y-%m-%d')})")
-                    
-                    # Size analysis
-                    if file_size == 0:
-                        empty_files.append(str(file_path))
-                    elif file_size > 100 * 1024 * 1024:  # >100MB
-                        large_files.append(f"{file_path.name} ({dependencies.format_size(file_size)})")
-                    
-                    # Security analysis
-                    if ext in suspicious_extensions:
-                        suspicious_files.append(str(file_path))
-                    
-                    if ext in executable_extensions:
-                        executable_files.append(str(file_path))
-                    
-                    if file.startswith('.'):
-                        hidden_files.append(str(file_path))
-                    
-                    # Check for suspicious patterns in filename
-                    filename_lower = file.lower()
-                    for pattern in suspicious_patterns:
-                        if pattern in filename_lower:
-                            suspicious_patterns[pattern].append(str(file_path))
-                    
-                    # Duplicate detection (for files < 50MB to avoid memory issues)
-                    if file_size < 50 * 1024 * 1024 and file_size > 0:
-                        try:
-                            with open(file_path, 'rb') as f:
-                                file_hash = hashlib.sha256(f.read()).hexdigest()
-                                duplicate_files[file_hash].append(str(file_path))
-                        except:
-                            pass
-                    
-                    # Content sampling for analysis
-                    if len(sample_files) < 15 and ext in {'.txt', '.py', '.js', '.html', '.css', '.md', '.json', '.xml', '.yml', '.yaml', '.log', '.cfg', '.ini'}:
-                        try:
-                            if file_size < 50000:  # Only smaller files
-                                content = file_path.read_text(encoding='utf-8', errors='ignore')[:1000]
-                                sample_files.append(f"[{ext}] {file_path.name}: {content[:150]}...")
-                        except:
-                            pass
-                            
-                except (OSError, PermissionError, UnicodeDecodeError):
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if is_dir:
+                    total_dirs += 1
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                    continue
+
+                dir_files += 1
+                try:
+                    # cached on the entry, on Windows it comes with the listing itself
+                    files.append((entry.path, entry.name, entry.stat()))
+                except OSError:
                     continue
+
+        depth_stats[depth] += 1
+        dir_file_counts[dir_files] += 1
+        # reversed so directories are visited in listing order, like os.walk
+        stack.extend((subdir, depth + 1) for subdir in reversed(subdirs))
+
+    return files, depth_stats, dir_file_counts, total_dirs
+
+_REPORT_LIST_CAP = 256
+
+class _CappedList(list):
+    """List that keeps only the first `cap` items but counts every append (in `total`).
+    The report shows a few examples per category, so huge trees don't have to keep every path."""
+    __slots__ = ('cap', 'total')
+
+    def __init__(self, cap: int = _REPORT_LIST_CAP):
+        super().__init__()
+        self.cap = cap
+        self.total = 0
+
+    def append(self, item):
+        self.total += 1
+        if len(self) < self.cap:
+            super().append(item)
+
+_FINGERPRINT_SIZE = 4096
+
+def _fingerprint_or_none(file_path: str, file_size: int) -> Optional[bytes]:
+    """Hash of the first and last 4 KiB, cheap way to tell most same-sized files apart.
+    Files up to 8 KiB are read whole, so for them it is the content hash itself."""
+    try:
+        with open(file_path, 'rb', buffering=0) as f:
+            head = f.read(_FINGERPRINT_SIZE)
+            if file_size > _FINGERPRINT_SIZE:
+                f.seek(max(_FINGERPRINT_SIZE, file_size - _FINGERPRINT_SIZE))
+                head += f.read(_FINGERPRINT_SIZE)
+        return _content_hash(head).digest()
+    except Exception:
+        return None
+
+def _find_duplicates(scanned: list[tuple[str, str, os.stat_result]]) -> dict[str, list[str]]:
+    """Group files by content hash (files < 50MB to avoid memory issues).
+    Files are narrowed down before the full hash: first by size, then by a head+tail fingerprint.
+    Hashing is IO bound, so files overlap in threads; results are grouped here in one thread."""
+    # files of different size can't be duplicates
+    by_size = defaultdict(list)
+    for file_path, _, file_stat in scanned:
+        if 0 < file_stat.st_size < 50 * 1024 * 1024:
+            by_size[file_stat.st_size].append((file_path, file_stat.st_size))
+
+    duplicate_files = defaultdict(list)  # hash -> [files]
+    candidates = [item for items in by_size.values() if len(items) > 1 for item in items]
+    if not candidates:
+        return duplicate_files
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        # same size, but different first/last 4 KiB -> not duplicates, no full read needed
+        by_fingerprint = defaultdict(list)
+        fingerprints = executor.map(_fingerprint_or_none, *zip(*candidates), chunksize=64)
+        for (file_path, size), fingerprint in zip(candidates, fingerprints):
+            if fingerprint is not None:
+                by_fingerprint[size, fingerprint].append((file_path, size))
+
+        candidates = []
+        for (size, fingerprint), items in by_fingerprint.items():
+            if len(items) < 2:
+                continue
+            if size <= 2 * _FINGERPRINT_SIZE:
+                # small files were hashed whole already, reading them again wouldn't add anything
+                duplicate_files[fingerprint.hex()].extend(file_path for file_path, _ in items)
+            else:
+                candidates.extend(items)
+
+        if candidates:
+            hashes = executor.map(_hash_or_none, *zip(*candidates), chunksize=64)
+            for (file_path, _), file_hash in zip(candidates, hashes):
+                if file_hash is not None:
+                    duplicate_files[file_hash].append(file_path)
+
+    return duplicate_files
+
+def _analyze_directory_sync(target_path: Path, path: str) -> tuple[str, Optional[str]]:
+    """Blocking part of analyze_directory_security: scan the tree and build the report.
+    Returns (report, prompt for AI analysis or None when there is no sample content)."""
+    # Enhanced data collection
+    # extensions are collected per file and counted once after the loop
+    file_exts = []
+    # only counts and the first few examples are reported
+    suspicious_files = _CappedList()
+    executable_files = _CappedList()
+    large_files = _CappedList()
+    hidden_files = _CappedList()
+    # (name, mtime), dates are formatted only for the few files shown in the report
+    recent_files = _CappedList()  # Modified in last 7 days
+    old_files = _CappedList()     # Not modified in last year
+    empty_files = _CappedList()
+    
+    # Time analysis
+    # epoch seconds, st_mtime is compared directly and formatted only for matches
+    now = time.time()
+    week_ago = now - 7 * 86400
+    year_ago = now - 365 * 86400
+    ext_to_mime = _ext_to_mime()
+    
+    # Security patterns
+    suspicious_patterns = {
+        'password': _CappedList(),
+        'key': _CappedList(),
+        'token': _CappedList(),
+        'secret': _CappedList(),
+        'credential': _CappedList()
+    }
+    
+    total_size = 0
+    total_files = 0
+    sample_files = []
+    
+    dependencies.logger.info(f"Starting comprehensive analysis of {target_path}")
+    
+    # phase 1: walk the tree (sequential), stat comes from the scandir entries
+    scanned, depth_stats, dir_file_counts, total_dirs = _scan_security_tree(target_path)
+    
+    # phase 2: duplicate detection, hashing runs in a thread pool
+    duplicate_files = _find_duplicates(scanned)
+    
+    for file_path, file, file_stat in scanned:
+        file_size = file_stat.st_size
+        total_size += file_size
+        total_files += 1
         
-        # Find actual duplicates (files with same hash but different paths)
-        actual_duplicates = {h: files for h, files in duplicate_files.items() if len(files) > 1}
-        
-        # Generate comprehensive analysis
-        analysis_parts = []
-        analysis_parts.append(f"📁 COMPREHENSIVE DIRECTORY ANALYSIS: {path}")
-        analysis_parts.append(f"📊 Files: {total_files:,} | Directories: {total_dirs:,} | Size: {dependencies.format_size(total_size)}")
-        analysis_parts.append("")
-        
-        # File types analysis (top 10)
-        analysis_parts.append("📋 FILE TYPES (Top 10):")
-        sorted_types = sorted(file_types.items(), key=lambda x: x[1], reverse=True)
-        for ext, count in sorted_types[:10]:
-            ext_display = ext if ext else "(no extension)"
-            percentage = (count / total_files) * 100
-            analysis_parts.append(f"  {ext_display}: {count:,} ({percentage:.1f}%)")
-        
-        # MIME types analysis (top 5)
-        if mime_types:
-            analysis_parts.append("\n🎭 MIME TYPES (Top 5):")
-            sorted_mimes = sorted(mime_types.items(), key=lambda x: x[1], reverse=True)
-            for mime, count in sorted_mimes[:5]:
-                analysis_parts.append(f"  {mime}: {count:,}")
+        # Basic file analysis
+        ext = os.path.splitext(file)[1].lower()
+        file_exts.append(ext)
         
         # Time analysis
-        analysis_parts.append(f"\n⏰ TIME ANALYSIS:")
-        analysis_parts.append(f"Recent files (last 7 days): {len(recent_files)}")
-        analysis_parts.append(f"Old files (>1 year): {len(old_files)}")
-        
-        # Structure analysis
-        max_depth = max(depth_stats.keys()) if depth_stats else 0
-        analysis_parts.append(f"\n🏗️ STRUCTURE:")
-        analysis_parts.append(f"Maximum depth: {max_depth} levels")
-        analysis_parts.append(f"Empty files: {len(empty_files)}")
-        
-        # Duplicates analysis
-        if actual_duplicates:
-            total_duplicate_files = sum(len(files) for files in actual_duplicates.values())
-            duplicate_waste = sum(
-                file_types.get(Path(files[0]).suffix.lower(), 0) * len(files) 
-                for files in actual_duplicates.values()
-            )
-            analysis_parts.append(f"🔄 Duplicates: {len(actual_duplicates)} sets, {total_duplicate_files} files")
-        
-        # Enhanced security assessment
-        analysis_parts.append("\n🔒 ENHANCED SECURITY ASSESSMENT:")
-        
-        security_score = 100
-        concerns = []
-        
-        # Threat scoring
-        if suspicious_files:
-            threat_score = min(40, len(suspicious_files) * 2)
-            security_score -= threat_score
-            concerns.append(f"⚠️  {len(suspicious_files)} potentially suspicious files")
-            
-        if executable_files:
-            exec_score = min(25, len(executable_files))
-            security_score -= exec_score
-            concerns.append(f"🔧 {len(executable_files)} executable files")
-            
-        if len(hidden_files) > 20:
-            security_score -= 20
-            concerns.append(f"👁️  Many hidden files ({len(hidden_files)})")
-            
-        # Pattern-based threats
-        pattern_threats = sum(len(files) for files in suspicious_patterns.values())
-        if pattern_threats > 0:
-            security_score -= min(15, pattern_threats)
-            concerns.append(f"🔍 {pattern_threats} files with suspicious naming patterns")
-            
-        # Size-based concerns
-        if total_size > 50 * 1024 * 1024 * 1024:  # >50GB
-            concerns.append(f"📦 Very large directory ({dependencies.format_size(total_size)})")
-        
-        # Old file concern
-        if len(old_files) > total_files * 0.5:
-            concerns.append(f"�️  Many old files ({len(old_files)}) - potential cleanup needed")
-        
-        analysis_parts.append(f"Security Score: {max(0, security_score)}/100")
-        
-        if concerns:
-            analysis_parts.append("Identified Concerns:")
-            for concern in concerns:
-                analysis_parts.append(f"  • {concern}")
-        else:
-            analysis_parts.append("✅ No major security concerns detected")
-        
-        # Detailed findings
-        if suspicious_files[:3]:
-            analysis_parts.append(f"\n🚨 SUSPICIOUS FILES (showing 3/{len(suspicious_files)}):")
-            for file in suspicious_files[:3]:
-                analysis_parts.append(f"  • {Path(file).name}")
-        
-        if any(suspicious_patterns.values()):
-            analysis_parts.append("\n� SUSPICIOUS NAMING PATTERNS:")
-            for pattern, files in suspicious_patterns.items():
-                if files:
-                    analysis_parts.append(f"  {pattern.upper()}: {len(files)} files")
-        
-        if actual_duplicates:
-            analysis_parts.append(f"\n🔄 DUPLICATE ANALYSIS (showing 3/{len(actual_duplicates)}):")
-            for i, (hash_val, files) in enumerate(list(actual_duplicates.items())[:3]):
-                analysis_parts.append(f"  Set {i+1}: {len(files)} identical files")
-                for file in files[:2]:  # Show first 2 of each set
-                    analysis_parts.append(f"    • {Path(file).name}")
-        
-        if recent_files[:5]:
-            analysis_parts.append(f"\n🆕 RECENT ACTIVITY (showing 5/{len(recent_files)}):")
-            for file in recent_files[:5]:
-                analysis_parts.append(f"  • {file}")
-        
-        basic_analysis = "\n".join(analysis_parts)
-        
-        # Enhanced AI analysis with more context
-        try:
-            from mcp.types import ClientCapabilities, SamplingCapability
-            sampling_cap = ClientCapabilities(sampling=SamplingCapability())
-            supports_sampling = ctx.session.check_client_capability(sampling_cap)
-            
-            if supports_sampling and sample_files:
-                analysis_prompt = f"""Analyze this directory comprehensively:
+        mod_time = file_stat.st_mtime
+        if mod_time > week_ago:
+            recent_files.append((file, mod_time))
+        elif mod_time < year_ago:
+            old_files.append((file, mod_time))
+        
+        # Size analysis
+        if file_size == 0:
+            empty_files.append(file_path)
+        elif file_size > 100 * 1024 * 1024:  # >100MB
+            large_files.append(f"{file} ({dependencies.format_size(file_size)})")
+        
+        # Security analysis
+        if ext in _SUSPICIOUS_EXTENSIONS:
+            suspicious_files.append(file_path)
+        if ext in _EXECUTABLE_EXTENSIONS:
+            executable_files.append(file_path)
+        if file[0] == '.':
+            hidden_files.append(file_path)
+        
+        # Check for suspicious patterns in filename (a name can match several of them)
+        for pattern in {m.group(1) for m in _SUSPICIOUS_NAME_RE.finditer(file.lower())}:
+            suspicious_patterns[pattern].append(file_path)
+        
+        # Content sampling for analysis (only smaller files),
+        # reading is the only thing in the loop that can fail, stat came from the scan
+        if len(sample_files) < 15 and ext in _SAMPLE_EXTENSIONS and file_size < 50000:
+            try:
+                with open(file_path, encoding='utf-8', errors='ignore') as f:
+                    content = f.read(1000)
+                sample_files.append(f"[{ext}] {file}: {content[:150]}...")
+            except OSError:
+                pass
+    
+    file_types = Counter(file_exts)
+    # MIME type analysis, the type depends only on the extension
+    mime_types = defaultdict(int)
+    for ext, count in file_types.items():
+        mime_type = ext_to_mime.get(ext)
+        if mime_type:
+            mime_types[mime_type] += count
+    
+    # Find actual duplicates (files with same hash but different paths)
+    actual_duplicates = {h: files for h, files in duplicate_files.items() if len(files) > 1}
+    
+    # Generate comprehensive analysis
+    analysis_parts = []
+    analysis_parts.append(f"📁 COMPREHENSIVE DIRECTORY ANALYSIS: {path}")
+    analysis_parts.append(f"📊 Files: {total_files:,} | Directories: {total_dirs:,} | Size: {dependencies.format_size(total_size)}")
+    analysis_parts.append("")
+    
+    # File types analysis (top 10)
+    analysis_parts.append("📋 FILE TYPES (Top 10):")
+    sorted_types = sorted(file_types.items(), key=lambda x: x[1], reverse=True)
+    for ext, count in sorted_types[:10]:
+        ext_display = ext if ext else "(no extension)"
+        percentage = (count / total_files) * 100
+        analysis_parts.append(f"  {ext_display}: {count:,} ({percentage:.1f}%)")
+    
+    # MIME types analysis (top 5)
+    if mime_types:
+        analysis_parts.append("\n🎭 MIME TYPES (Top 5):")
+        sorted_mimes = sorted(mime_types.items(), key=lambda x: x[1], reverse=True)
+        for mime, count in sorted_mimes[:5]:
+            analysis_parts.append(f"  {mime}: {count:,}")
+    
+    # Time analysis
+    analysis_parts.append(f"\n⏰ TIME ANALYSIS:")
+    analysis_parts.append(f"Recent files (last 7 days): {recent_files.total}")
+    analysis_parts.append(f"Old files (>1 year): {old_files.total}")
+    
+    # Structure analysis
+    max_depth = max(depth_stats.keys()) if depth_stats else 0
+    analysis_parts.append(f"\n🏗️ STRUCTURE:")
+    analysis_parts.append(f"Maximum depth: {max_depth} levels")
+    analysis_parts.append(f"Empty files: {empty_files.total}")
+    
+    # Duplicates analysis
+    if actual_duplicates:
+        total_duplicate_files = sum(len(files) for files in actual_duplicates.values())
+        duplicate_waste = sum(
+            file_types.get(Path(files[0]).suffix.lower(), 0) * len(files) 
+            for files in actual_duplicates.values()
+        )
+        analysis_parts.append(f"🔄 Duplicates: {len(actual_duplicates)} sets, {total_duplicate_files} files")
+    
+    # Enhanced security assessment
+    analysis_parts.append("\n🔒 ENHANCED SECURITY ASSESSMENT:")
+    
+    security_score = 100
+    concerns = []
+    
+    # Threat scoring
+    if suspicious_files:
+        threat_score = min(40, suspicious_files.total * 2)
+        security_score -= threat_score
+        concerns.append(f"⚠️  {suspicious_files.total} potentially suspicious files")
+        
+    if executable_files:
+        exec_score = min(25, executable_files.total)
+        security_score -= exec_score
+        concerns.append(f"🔧 {executable_files.total} executable files")
+        
+    if hidden_files.total > 20:
+        security_score -= 20
+        concerns.append(f"👁️  Many hidden files ({hidden_files.total})")
+        
+    # Pattern-based threats
+    pattern_threats = sum(files.total for files in suspicious_patterns.values())
+    if pattern_threats > 0:
+        security_score -= min(15, pattern_threats)
+        concerns.append(f"🔍 {pattern_threats} files with suspicious naming patterns")
+        
+    # Size-based concerns
+    if total_size > 50 * 1024 * 1024 * 1024:  # >50GB
+        concerns.append(f"📦 Very large directory ({dependencies.format_size(total_size)})")
+    
+    # Old file concern
+    if old_files.total > total_files * 0.5:
+        concerns.append(f"�️  Many old files ({old_files.total}) - potential cleanup needed")
+    
+    analysis_parts.append(f"Security Score: {max(0, security_score)}/100")
+    
+    if concerns:
+        analysis_parts.append("Identified Concerns:")
+        for concern in concerns:
+            analysis_parts.append(f"  • {concern}")
+    else:
+        analysis_parts.append("✅ No major security concerns detected")
+    
+    # Detailed findings
+    if suspicious_files[:3]:
+        analysis_parts.append(f"\n🚨 SUSPICIOUS FILES (showing 3/{suspicious_files.total}):")
+        for file in suspicious_files[:3]:
+            analysis_parts.append(f"  • {Path(file).name}")
+    
+    if any(suspicious_patterns.values()):
+        analysis_parts.append("\n� SUSPICIOUS NAMING PATTERNS:")
+        for pattern, files in suspicious_patterns.items():
+            if files:
+                analysis_parts.append(f"  {pattern.upper()}: {files.total} files")
+    
+    if actual_duplicates:
+        analysis_parts.append(f"\n🔄 DUPLICATE ANALYSIS (showing 3/{len(actual_duplicates)}):")
+        for i, (hash_val, files) in enumerate(list(actual_duplicates.items())[:3]):
+            analysis_parts.append(f"  Set {i+1}: {len(files)} identical files")
+            for file in files[:2]:  # Show first 2 of each set
+                analysis_parts.append(f"    • {Path(file).name}")
+    
+    if recent_files[:5]:
+        analysis_parts.append(f"\n🆕 RECENT ACTIVITY (showing 5/{recent_files.total}):")
+        for file, mod_time in recent_files[:5]:
+            analysis_parts.append(f"  • {file} ({datetime.fromtimestamp(mod_time):%Y-%m-%d})")
+    
+    basic_analysis = "\n".join(analysis_parts)
+    
+    # Enhanced AI analysis with more context
+    if not sample_files:
+        return basic_analysis, None
+    
+    analysis_prompt = f"""Analyze this directory comprehensively:
 
                     STATISTICS:
                     - {total_files:,} files, {total_dirs:,} directories, {dependencies.format_size(total_size)}
                     - Top types: {', '.join([f"{ext}({count})" for ext, count in sorted_types[:5]])}
                     - Security score: {max(0, security_score)}/100
-                    - {len(recent_files)} recent files, {len(old_files)} old files
-                    - {len(actual_duplicates)} duplicate sets, {len(empty_files)} empty files
+                    - {recent_files.total} recent files, {old_files.total} old files
+                    - {len(actual_duplicates)} duplicate sets, {empty_files.total} empty files
 
                     SAMPLE CONTENT:
                     {chr(10).join(sample_files[:8])}
@@ -440,7 +619,7 @@ async def analyze_directory_security(path: str, ctx: Context) -> str:
                     {chr(10).join(concerns) if concerns else "None detected"}
 
                     SUSPICIOUS PATTERNS:
-                    {chr(10).join([f"{k}: {len(v)}" for k, v in suspicious_patterns.items() if v])}
+                    {chr(10).join([f"{k}: {v.total}" for k, v in suspicious_patterns.items() if v])}
 
                     Provide intelligent analysis covering:
                     1. Directory purpose/type identification
@@ -452,6 +631,30 @@ async def analyze_directory_security(path: str, ctx: Context) -> str:
 
                     Be specific, actionable, under 300 words."""
 
+    return basic_analysis, analysis_prompt
+
+async def analyze_directory_security(path: str, ctx: Context) -> str:
+    """
+    Provides comprehensive security and content analysis of a directory.
+    
+    Analyzes file types, potential security risks, content overview,
+    and provides intelligent assessment using AI sampling if available.
+    
+    Args:
+        path: Directory path to analyze
+        ctx: MCP context for security validation and AI capabilities
+    """
+    try:
+        target_path = await dependencies.validate_path(path, ctx, must_exist=True, expected_type='dir')
+        
+        # the scan is blocking, only the sampling request stays on the event loop
+        basic_analysis, analysis_prompt = await dependencies.run_blocking(_analyze_directory_sync, target_path, path)
+        
+        # Enhanced AI analysis with more context
+        try:
+            supports_sampling = dependencies.checkSamplingCapability(ctx.session)
+            
+            if supports_sampling and analysis_prompt:
                 try:
                     ai_response = await ctx.sample(
                         analysis_prompt,
@@ -472,6 +675,56 @@ async def analyze_directory_security(path: str, ctx: Context) -> str:
     except Exception as e:
         return f"Error analyzing directory: {str(e)}"
 
+_SNIFF_SIZE = 8192
+
+def _looks_binary(head: bytes) -> bool:
+    # bytes.find with a one byte needle is a memchr call, fast even for the whole window
+    return head.find(b'\x00') != -1
+
+def _collect_file_info(target_path: Path, stats: os.stat_result) -> list[str]:
+    """Blocking part of get_file_info: binary sniff and item count, type comes from the given stat."""
+    is_dir = stat.S_ISDIR(stats.st_mode)
+    
+    info = [
+        f"Path: {target_path}",
+        f"Name: {target_path.name}",
+        f"Type: {'Directory' if is_dir else 'File'}",
+        f"Size: {dependencies.format_size(stats.st_size)}",
+        f"Modified: {dependencies.format_timestamp(stats.st_mtime)}",
+        # st_birthtime is missing on most Linux filesystems, ctime is the closest there
+        f"Created: {dependencies.format_timestamp(getattr(stats, 'st_birthtime', stats.st_ctime))}",
+        f"Permissions: {oct(stats.st_mode)[-3:]}",
+    ]
+    
+    if stat.S_ISREG(stats.st_mode):
+        # Add file-specific info
+        try:
+            # raw descriptor: no file object and no extra fstat for buffer sizing, just open/read/close
+            fd = os.open(target_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_CLOEXEC', 0))
+            try:
+                is_binary = _looks_binary(os.read(fd, _SNIFF_SIZE))
+            finally:
+                os.close(fd)
+            info.append(f"Binary: {'Yes' if is_binary else 'No'}")
+            
+            if not is_binary and target_path.suffix:
+                info.append(f"Extension: {target_path.suffix}")
+                
+        except Exception:
+            pass
+    
+    elif is_dir:
+        # Add directory-specific info
+        try:
+            # counted while iterating, no Path per entry and no list of them
+            with os.scandir(target_path) as it:
+                item_count = sum(1 for _ in it)
+            info.append(f"Items: {item_count}")
+        except Exception:
+            pass
+
+    return info
+
 async def get_file_info(path: str, ctx: Context) -> str:
     """Get detailed metadata about a file or directory.
     
@@ -479,54 +732,27 @@ async def get_file_info(path: str, ctx: Context) -> str:
         path: Path to the file or directory
     """
     try:
-        target_path = dependencies.check_path(Path(path))
+        target_path = dependencies.check_path(Path(path), check_existence=False)
         
-        if not dependencies.withinAllowed(target_path, ctx):
+        if not await dependencies.withinAllowed(target_path, ctx):
             return f"Error: Path '{path}' is not within allowed roots"
         
-        if not target_path.exists():
+        stats = dependencies.stat_or_none(target_path)
+        if stats is None:
             return f"Error: Path '{path}' does not exist"
         
-        stats = target_path.stat()
-        
-        info = [
-            f"Path: {target_path}",
-            f"Name: {target_path.name}",
-            f"Type: {'Directory' if target_path.is_dir() else 'File'}",
-            f"Size: {dependencies.format_size(stats.st_size)}",
-            f"Modified: {dependencies.format_timestamp(stats.st_mtime)}",
-            f"Created: {dependencies.format_timestamp(stats.st_birthtime)}",
-            f"Permissions: {oct(stats.st_mode)[-3:]}",
-        ]
-        
-        if target_path.is_file():
-            # Add file-specific info
-            try:
-                with open(target_path, 'rb') as f:
-                    first_bytes = f.read(100)
-                    is_binary = b'\x00' in first_bytes
-                info.append(f"Binary: {'Yes' if is_binary else 'No'}")
-                
-                if not is_binary and target_path.suffix:
-                    info.append(f"Extension: {target_path.suffix}")
-                    
-            except Exception:
-                pass
-        
-        elif target_path.is_dir():
-            # Add directory-specific info
-            try:
-                item_count = len(list(target_path.iterdir()))
-                info.append(f"Items: {item_count}")
-            except Exception:
-                pass
-        
+        info = await dependencies.run_blocking(_collect_file_info, target_path, stats)
         return "\n".join(info)
     
     except Exception as e:
         return f"Error: {str(e)}"
 
 
+def _move(source_path: Path, dest_path: Path) -> None:
+    # Create parent directories if needed
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    source_path.rename(dest_path)
+
 async def move_file(source: str, destination: str, ctx: Context) -> str:
     """Move or rename files and directories.
     
@@ -535,31 +761,87 @@ async def move_file(source: str, destination: str, ctx: Context) -> str:
         destination: Destination path
     """
     try:
-        source_path = dependencies.check_path(Path(source))
-        dest_path = dependencies.check_path(Path(destination))
+        # existence is checked below with one stat each (destination usually doesn't exist yet)
+        source_path = dependencies.check_path(Path(source), check_existence=False)
+        dest_path = dependencies.check_path(Path(destination), check_existence=False)
         
-        if not dependencies.withinAllowed(source_path, ctx):
+        # roots are fetched once for both checks
+        allowed_roots = await dependencies.get_combined_roots(ctx)
+        if not dependencies.is_within_roots(source_path, allowed_roots):
             return f"Error: Source path '{source}' is not within allowed roots"
         
-        if not dependencies.withinAllowed(dest_path, ctx):
+        if not dependencies.is_within_roots(dest_path, allowed_roots):
             return f"Error: Destination path '{destination}' is not within allowed roots"
         
-        if not source_path.exists():
+        if dependencies.stat_or_none(source_path) is None:
             return f"Error: Source '{source}' does not exist"
         
-        if dest_path.exists():
+        if dependencies.stat_or_none(dest_path) is not None:
             return f"Error: Destination '{destination}' already exists"
         
-        # Create parent directories if needed
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        source_path.rename(dest_path)
+        await dependencies.run_blocking(_move, source_path, dest_path)
+        dependencies.invalidate_path_cache()
         return f"Successfully moved '{source}' to '{destination}'"
     
     except Exception as e:
         return f"Error moving file: {str(e)}"
 
 
+# "*.py" or "**/*.py": only the file name suffix matters, no regex needed
+_SUFFIX_GLOB = re.compile(r'(?:\*\*/)?\*([^*?\[\]/]+)')
+
+def _glob_matches(search_path: Path, pattern: str, exclude_patterns: List[str], roots: Optional[List[Path]] = None) -> list[str]:
+    """Walk search_path with scandir and return paths whose relative path matches the glob pattern.
+    '**' matches any number of directories, without it the walk stops at the pattern's depth.
+    Excluded directories are skipped with everything inside them."""
+    recursive = '**' in pattern
+    max_depth = None if recursive else pattern.count('/') + 1
+
+    suffix_match = _SUFFIX_GLOB.fullmatch(pattern)
+    suffix = os.path.normcase(suffix_match.group(1)) if suffix_match else None
+    # the pattern is translated and compiled once instead of being re-parsed for every directory
+    include_re = None if suffix else re.compile(
+        glob.translate(pattern, recursive=True, include_hidden=True, seps='/'),
+        re.IGNORECASE if os.name == 'nt' else 0,
+    )
+    exclude_re = dependencies.compile_globs(exclude_patterns)
+
+    matches = []
+    stack = [(os.fspath(search_path), "", 1)]
+    while stack:
+        dir_path, rel_dir, depth = stack.pop()
+        try:
+            it = os.scandir(dir_path)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                rel_path = rel_dir + name
+                # excluded directories are skipped with everything inside them
+                if exclude_re is not None and (exclude_re.match(rel_path) or exclude_re.match(name)):
+                    continue
+
+                if suffix is not None:
+                    matched = os.path.normcase(name).endswith(suffix)
+                else:
+                    matched = include_re.match(rel_path) is not None
+                if matched:
+                    matches.append(entry.path)
+
+                if max_depth is None or depth < max_depth:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        # like Path.glob: '**' doesn't go through symlinked directories, other patterns do
+                        # (their depth is bounded, so no loops), but only into ones that resolve inside the roots
+                        if not is_dir and not recursive and roots is not None and entry.is_symlink():
+                            is_dir = entry.is_dir() and dependencies.is_within_roots(Path(entry.path), roots)
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        stack.append((entry.path, rel_path + '/', depth + 1))
+    return matches
+
 async def search_files(path: str, pattern: str, ctx: Context, exclude_patterns: List[str] = None) -> str:
     """Search for files matching a pattern.
     
@@ -575,26 +857,33 @@ async def search_files(path: str, pattern: str, ctx: Context, exclude_patterns:
         if exclude_patterns is None or exclude_patterns == []:
             exclude_patterns = []
         
-        matches = []
-        
-        # Use ** for recursive search
-        glob_iter = search_path.rglob(pattern.replace('**/', '')) if '**' in pattern else search_path.glob(pattern)
-
-        for file_path in glob_iter:
-            if dependencies.should_include_file(file_path, search_path, exclude_patterns):
-                matches.append(str(file_path))
+        roots = await dependencies.get_combined_roots(ctx)
+        matches = await dependencies.run_blocking(_glob_matches, search_path, pattern, exclude_patterns, roots)
 
         if not matches:
             return f"No files found matching pattern '{pattern}' in '{path}'"
         
         matches.sort()
-        result = f"Found {len(matches)} files matching '{pattern}':\n"
-        result += "\n".join(matches)
-        return result
+        # one join, instead of building the body and then copying it into the header string
+        return "\n".join([f"Found {len(matches)} files matching '{pattern}':", *matches])
     
     except Exception as e:
         return f"Error searching files: {str(e)}"
 
+_READ_CONCURRENCY = 32
+
+def _read_text_file(path: Path) -> Optional[str]:
+    """Blocking part of read_multiple_files, None if path is not a regular file."""
+    if not path.is_file():
+        return None
+    with open(path, encoding='utf-8') as f:
+        # peek at the first buffer (no extra read): if the header already isn't valid utf-8 the whole
+        # file would fail to decode, so it's rejected without reading the rest. NUL bytes are valid utf-8,
+        # files with them are read as before. The incremental decoder allows a character cut at the end.
+        head = f.buffer.peek(_SNIFF_SIZE)[:_SNIFF_SIZE]
+        codecs.getincrementaldecoder('utf-8')().decode(head)
+        return f.read()
+
 async def read_multiple_files(paths: List[str], ctx: Context) -> str:
     """Read contents of multiple files simultaneously.
     
@@ -605,29 +894,32 @@ async def read_multiple_files(paths: List[str], ctx: Context) -> str:
         if not paths:
             return "Error: No file paths provided"
         
-        results = []
+        # one slow file shouldn't hold the others, reads run in threads side by side
+        # (bounded, so a huge list doesn't open hundreds of files at once)
+        limiter = asyncio.Semaphore(_READ_CONCURRENCY)
         
-        for file_path in paths:
+        async def read_one(file_path: str) -> str:
             try:
                 # this ensures no loop stopping when one file is not accessible,
                 #  and also provides individual error messages for each file
                 target_path = dependencies.check_path(file_path, check_existence=True)
                 
-                if not dependencies.withinAllowed(target_path, ctx):
-                    results.append(f"{file_path}: Error - Path not within allowed roots")
-                    continue
+                if not await dependencies.withinAllowed(target_path, ctx):
+                    return f"{file_path}: Error - Path not within allowed roots"
                 
-                if not target_path.is_file():
-                    results.append(f"{file_path}: Error - Not a file")
-                    continue
-                
-                content = target_path.read_text(encoding='utf-8')
-                results.append(f"{file_path}:\n{content}")
+                async with limiter:
+                    content = await dependencies.run_blocking(_read_text_file, target_path)
+                if content is None:
+                    return f"{file_path}: Error - Not a file"
+                return f"{file_path}:\n{content}"
                 
             except UnicodeDecodeError:
-                results.append(f"{file_path}: Error - Binary file or unsupported encoding")
+                return f"{file_path}: Error - Binary file or unsupported encoding"
             except Exception as e:
-                results.append(f"{file_path}: Error - {str(e)}")
+                return f"{file_path}: Error - {str(e)}"
+        
+        # gather keeps the order of paths
+        results = await asyncio.gather(*(read_one(file_path) for file_path in paths))
         
         return "\n---\n".join(results)
     
@@ -658,7 +950,8 @@ async def delete_file(path: str, ctx: Context, confirm: bool = False) -> str:
                     )
                     if user_agreed:
                         # delete recursively
-                        target_path.unlink()
+                        await dependencies.run_blocking(target_path.unlink)
+                        dependencies.invalidate_path_cache()
                         return f"Successfully deleted file '{path}' via elicitation"
                     else:
                         return "Cancelled by user."
@@ -698,7 +991,8 @@ async def delete_directory(path: str, confirm: bool = False, ctx: Context = None
                 )
                 if user_agreed:
                     # delete recursively
-                    shutil.rmtree(target_path)
+                    await dependencies.run_blocking(shutil.rmtree, target_path)
+                    dependencies.invalidate_path_cache()
                     return "Deleted via elicitation."
                 else:
                     return "Cancelled by user."
@@ -711,9 +1005,55 @@ async def delete_directory(path: str, confirm: bool = False, ctx: Context = None
             "Please ask the user for permission, then call this tool again with `confirm=True` and try again."
         )
 
-    shutil.rmtree(target_path)
+    await dependencies.run_blocking(shutil.rmtree, target_path)
+    dependencies.invalidate_path_cache()
     return f"Successfully deleted '{path}' (Confirmed)."
 
+def _scan_tree(top: Path | str, subdirs_out: Optional[list[str]] = None) -> tuple[int, int, int]:
+    """Walk the tree with scandir and return (total size, files, directories).
+    Counts match os.walk: symlinks are counted but not followed, and their size is skipped.
+    With subdirs_out only top itself is scanned, its subdirectories are collected there instead."""
+    total_size = 0
+    num_files = 0
+    num_dirs = 0
+    stack = [os.fspath(top)]
+    pending = stack if subdirs_out is None else subdirs_out
+
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            # same as os.walk, unreadable directories are skipped
+            continue
+        with it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if is_dir:
+                    num_dirs += 1
+                    if not entry.is_symlink():
+                        pending.append(entry.path)
+                else:
+                    num_files += 1
+                    if not entry.is_symlink():
+                        try:
+                            # lstat result is cached on the entry, no separate getsize() call
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            pass
+
+    return total_size, num_files, num_dirs
+
+# small trees are walked in one thread, splitting them costs more than it saves
+_PARALLEL_SUMMARY_MIN_SUBDIRS = 4
+
+def _scan_subtrees(tops: list[str]) -> tuple[int, int, int]:
+    totals = [_scan_tree(top) for top in tops]
+    return sum(t[0] for t in totals), sum(t[1] for t in totals), sum(t[2] for t in totals)
+
 async def filesystem_summary(path: str, ctx: Context) -> dict:
     """
     Provides a summary of the filesystem at a given path.
@@ -723,18 +1063,20 @@ async def filesystem_summary(path: str, ctx: Context) -> dict:
     """
     target_path = await dependencies.validate_path(path, ctx, must_exist=True, expected_type='dir')
 
-    total_size = 0
-    num_files = 0
-    num_dirs = 0
+    # a deep tree takes a while, so the walk must not block the event loop;
+    # top level first, then its subtrees in parallel (stat calls overlap well on SSD/NVMe)
+    subdirs: list[str] = []
+    total_size, num_files, num_dirs = await dependencies.run_blocking(_scan_tree, target_path, subdirs)
 
-    for dirpath, dirnames, filenames in os.walk(target_path):
-        num_dirs += len(dirnames)
-        num_files += len(filenames)
-        for f in filenames:
-            fp = os.path.join(dirpath, f)
-            # skip if it is symbolic link
-            if not os.path.islink(fp):
-                total_size += os.path.getsize(fp)
+    if len(subdirs) < _PARALLEL_SUMMARY_MIN_SUBDIRS:
+        parts = [await dependencies.run_blocking(_scan_subtrees, subdirs)]
+    else:
+        parts = await asyncio.gather(*(dependencies.run_blocking(_scan_tree, d) for d in subdirs))
+
+    for size, files, dirs in parts:
+        total_size += size
+        num_files += files
+        num_dirs += dirs
 
     return {
         "path": str(target_path),
@@ -743,6 +1085,16 @@ async def filesystem_summary(path: str, ctx: Context) -> dict:
         "directories": num_dirs,
     }
 
+_PREVIEW_CHARS = 1000
+
+def _read_preview(path: Path) -> tuple[str, bool]:
+    """First _PREVIEW_CHARS characters of a text file and whether the file is longer.
+    Text mode decodes strictly and translates newlines like read_text did, but stops after the
+    chunks holding those characters (one more char tells if the file is longer)."""
+    with open(path, encoding='utf-8') as f:
+        text = f.read(_PREVIEW_CHARS + 1)
+    return text[:_PREVIEW_CHARS], len(text) > _PREVIEW_CHARS
+
 async def get_creative_file_description(path: str, ctx: Context) -> str:
     """
     Generates a creative, imaginative description of a file's contents.
@@ -751,8 +1103,8 @@ async def get_creative_file_description(path: str, ctx: Context) -> str:
     # First read the file content directly
     try:
         target_path = await dependencies.validate_path(path, ctx, must_exist=True, expected_type='file')
-        content = target_path.read_text(encoding='utf-8')
-        content_summary = f"File: {path}\nContent preview: {content[:1000]}..." if len(content) > 1000 else f"File: {path}\nContent: {content}"
+        content, truncated = await dependencies.run_blocking(_read_preview, target_path)
+        content_summary = f"File: {path}\nContent preview: {content}..." if truncated else f"File: {path}\nContent: {content}"
     except UnicodeDecodeError:
         return f"Error: File '{path}' contains binary data or unsupported encoding"
     except Exception as e:
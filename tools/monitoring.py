@@ -4,9 +4,12 @@ import socket
 import sys
 from datetime import datetime
 from fastmcp import Context
+from utilities import dependencies
 
-async def get_system_resource_usage(ctx: Context) -> dict:
-    """Get current CPU and Memory usage statistics."""
+# psutil calls block (cpu_percent sleeps for its interval, DNS lookup for the ip),
+# so the tools run them in the fs thread pool and keep the event loop free
+
+def _resource_usage() -> dict:
     vm = psutil.virtual_memory()
     return {
         "cpu_percent": psutil.cpu_percent(interval=0.1),
@@ -16,8 +19,11 @@ async def get_system_resource_usage(ctx: Context) -> dict:
         "release": platform.release()
     }
 
-async def get_disk_status(ctx: Context) -> list[dict]:
-    """Get usage statistics for all mounted disk partitions."""
+async def get_system_resource_usage(ctx: Context) -> dict:
+    """Get current CPU and Memory usage statistics."""
+    return await dependencies.run_blocking(_resource_usage)
+
+def _disk_status() -> list[dict]:
     disks = []
     for partition in psutil.disk_partitions():
         try:
@@ -33,11 +39,11 @@ async def get_disk_status(ctx: Context) -> list[dict]:
             continue
     return disks
 
-async def get_system_info(ctx: Context) -> dict:
-    """
-    Get static system information: OS details, Hardware specs, Network ID, Uptime.
-    Use this to understand the environment the server is running on.
-    """
+async def get_disk_status(ctx: Context) -> list[dict]:
+    """Get usage statistics for all mounted disk partitions."""
+    return await dependencies.run_blocking(_disk_status)
+
+def _system_info() -> dict:
     #  Uptime
     boot_time_timestamp = psutil.boot_time()
     boot_time = datetime.fromtimestamp(boot_time_timestamp)
@@ -79,6 +85,13 @@ async def get_system_info(ctx: Context) -> dict:
     
     return info
 
+async def get_system_info(ctx: Context) -> dict:
+    """
+    Get static system information: OS details, Hardware specs, Network ID, Uptime.
+    Use this to understand the environment the server is running on.
+    """
+    return await dependencies.run_blocking(_system_info)
+
 def register(mcp):
     # function for registering monitoring functions as tools in the MCP server, e.g. router
     mcp.tool(tags=["monitoring"])(get_system_resource_usage)
@@ -8,11 +8,7 @@ async def get_server_status(ctx: Context) -> dict:
     """Get information about server status, client features, and allowed roots."""
     dependencies.logger.info("Checking server status")
     
-    features = {
-        "elicitation": dependencies.checkElicitationCapability(ctx.session),
-        "sampling": dependencies.checkSamplingCapability(ctx.session),
-        "roots": dependencies.checkRootsCapability(ctx.session),
-    }
+    features = dependencies.get_client_features(ctx.session)
     
     client_roots_list = []
     if features["roots"]:
@@ -58,6 +54,7 @@ async def add_allowed_root(path: str, ctx: Context) -> str:
 
         if path_obj not in settings.ALLOWED_ROOTS:
             settings.ALLOWED_ROOTS.append(path_obj)
+            dependencies.invalidate_roots_cache()
             return f"Successfully added '{path_obj}' to allowed roots."
         
         return f"Path '{path_obj}' is already in allowed roots."
@@ -86,8 +83,10 @@ async def update_roots(newroots: List[str]) -> str:
             return "Error: No valid directories provided"
         
         settings.ALLOWED_ROOTS.clear()
-        settings.ALLOWED_ROOTS.extend(new_roots)
-        return f"Updated allowed roots to {len(new_roots)} directories"
+        # same directory given twice is kept once
+        settings.ALLOWED_ROOTS.extend(dict.fromkeys(new_roots))
+        dependencies.invalidate_roots_cache()
+        return f"Updated allowed roots to {len(settings.ALLOWED_ROOTS)} directories"
     
     except Exception as e:
         return f"Error updating roots: {str(e)}"
@@ -103,6 +102,7 @@ async def remove_root(root: str) -> str:
             return f"Error: Root '{root}' not found in allowed roots"
 
         settings.ALLOWED_ROOTS.remove(path_obj)
+        dependencies.invalidate_roots_cache()
         return f"Removed root '{root}'"
     except (TypeError, ValueError, OSError) as exc:
         return f"Error processing path '{root}': {str(exc)}"
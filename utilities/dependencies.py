@@ -1,16 +1,79 @@
+import asyncio
+import atexit
+import contextvars
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal, Optional, List
+import fnmatch
 import os
+import re
+import stat
+import sys
+import time
+import weakref
+from datetime import datetime
 import fastmcp
 from config import settings
 from pathlib import Path
 from mcp import ServerSession
-from mcp.types import ClientCapabilities, ElicitationCapability, RootsCapability, SamplingCapability
+from mcp.types import ClientCapabilities, ElicitationCapability, RootsCapability, SamplingCapability, RootsListChangedNotification
 from fastmcp.server.middleware import MiddlewareContext
 from urllib.parse import urlparse, unquote
+from bisect import bisect_right
+from functools import lru_cache, partial
 
 logger = logging.getLogger("fastmcp")
 
+# session -> (fetch time, root uris, parsed roots)
+# within settings.CLIENT_ROOTS_TTL the roots are served without asking the client again,
+# after that the client is asked, but uris are re-parsed only if the list really changed.
+# keyed by the session object itself (not id(), which is reused after gc), entry goes away with the session
+_CLIENT_ROOTS_CACHE: weakref.WeakKeyDictionary[ServerSession, tuple[float, tuple[str, ...], tuple[Path, ...]]] = weakref.WeakKeyDictionary()
+
+# raw path string -> (resolve time, resolved path)
+# kept short (settings.PATH_CACHE_TTL), since a symlink can be re-pointed at any time
+_RESOLVE_CACHE: dict[str, tuple[float, Path]] = {}
+_RESOLVE_CACHE_MAX = 1024
+
+# one long-lived pool for blocking filesystem work of all tools
+# (default executor of asyncio.to_thread is sized for CPU, not for waiting on disks/NFS)
+_FS_EXECUTOR = ThreadPoolExecutor(max_workers=settings.FS_WORKERS, thread_name_prefix="fs")
+atexit.register(_FS_EXECUTOR.shutdown, wait=False)
+
+async def run_blocking(func, /, *args, **kwargs):
+    """Like asyncio.to_thread, but runs func in the shared filesystem pool."""
+    loop = asyncio.get_running_loop()
+    call = partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await loop.run_in_executor(_FS_EXECUTOR, call)
+
+def invalidate_client_roots(session: Optional[ServerSession] = None) -> None:
+    """Forget cached client roots (for one session or for all of them)."""
+    if session is None:
+        _CLIENT_ROOTS_CACHE.clear()
+    else:
+        _CLIENT_ROOTS_CACHE.pop(session, None)
+
+def invalidate_roots_cache() -> None:
+    """Forget everything cached about roots, used when allowed roots are changed at runtime."""
+    invalidate_client_roots()
+    _root_prefixes.cache_clear()
+    invalidate_path_cache()
+
+def register_notifications(mcp: fastmcp.FastMCP) -> None:
+    """Drop cached client roots when a client reports that its roots changed."""
+    low_level = getattr(mcp, "_mcp_server", None)
+    handlers = getattr(low_level, "notification_handlers", None)
+    if handlers is None:
+        logger.debug("Roots change notifications are not available, relying on TTL only")
+        return
+
+    async def on_roots_changed(notification: RootsListChangedNotification) -> None:
+        # low level handlers don't get the session, so all sessions are refreshed
+        logger.info("Client roots changed, dropping cached roots")
+        invalidate_client_roots()
+
+    handlers[RootsListChangedNotification] = on_roots_changed
+
 async def get_combined_roots(context: fastmcp.Context) -> list[Path]:
     result_list: list[Path] = []
     if settings.ALLOWED_ROOTS is not None:
@@ -18,9 +81,10 @@ async def get_combined_roots(context: fastmcp.Context) -> list[Path]:
     if checkRootsCapability(context.session):
         clients_roots = await fetch_roots_from_client(context)
         if clients_roots is not None:
-            clients_roots_checked = [check_path(p) for p in clients_roots]
-            result_list.extend(clients_roots_checked)
-    return result_list
+            # already resolved by uri_to_path, no need to resolve them again on every call
+            result_list.extend(clients_roots)
+    # same root from server and client (or given twice) is kept once, order preserved
+    return list(dict.fromkeys(result_list))
 
 # def convert_roots_to_str() -> list[Path]:
 #     ROOTS_STR: dict[str, list[Path]] = {
@@ -36,21 +100,55 @@ def uri_to_path(uri: str) -> Path:
     """Convert a file:// URI to a Path object."""
     " For example from file://C:\Program Files\ to Path('C:/Program Files')"
     " Path must contain slash at the end and not have any spelling mistakes "
+    # client roots are almost always plain file:///abs/path, no need for full url parsing.
+    # not cached: the result depends on the filesystem (realpath, existence), and unchanged
+    # root lists aren't re-parsed anyway (see fetch_roots_from_client)
+    if uri.startswith("file:///") and "?" not in uri and "#" not in uri:
+        return check_path(Path(unquote(uri[7:])))
+
     p = urlparse(uri)
     if p.scheme != "file":
         raise ValueError(f"URI must start with file:// or another scheme but not {p.scheme}")
     file = Path(unquote(p.path))
     return check_path(file)
 
+def invalidate_path_cache() -> None:
+    """Forget cached path resolutions (after moves/deletes, when symlinks may point elsewhere)."""
+    _RESOLVE_CACHE.clear()
+
+def _resolve_lenient(value: Path) -> Path:
+    """expanduser + non-strict resolve, cached for settings.PATH_CACHE_TTL seconds."""
+    key = os.fspath(value)
+    now = time.monotonic()
+    cached = _RESOLVE_CACHE.get(key)
+    if cached is not None and now - cached[0] < settings.PATH_CACHE_TTL:
+        return cached[1]
+
+    resolved = Path(os.path.expanduser(value)).resolve()
+    if len(_RESOLVE_CACHE) >= _RESOLVE_CACHE_MAX:
+        _RESOLVE_CACHE.clear()
+    _RESOLVE_CACHE[key] = (now, resolved)
+    return resolved
+
 def check_path(value:Path | str, check_existence: bool = True) -> Path:
     try:
         # explicitly converts it to Path 
         if isinstance(value, str):
             value = Path(value)
 
-        value = Path(os.path.expanduser(value)).resolve()
+        # validate_path and withinAllowed resolve the same paths again and again within one
+        # chained workflow, realpath is a syscall per component, so those results are reused
+        if not check_existence:
+            return _resolve_lenient(value)
+
+        value = Path(os.path.expanduser(value))
 
-        if check_existence and not value.exists():
+        # strict resolve already stats every component, so no separate exists() call.
+        # anything it fails on (missing, not a directory, no permission, symlink loop) is where
+        # the old exists() returned False, so it's the same "does not exist" ValueError
+        try:
+            value = value.resolve(strict=check_existence)
+        except (OSError, RuntimeError):
             raise ValueError(f"Error: Path '{value}' does not exist")
     
         return value
@@ -59,6 +157,13 @@ def check_path(value:Path | str, check_existence: bool = True) -> Path:
         logger.error(f"Invalid path specified: {value}", exc_info=exc)
         raise
 
+def check_paths(values: List[Path | str], check_existence: bool = True) -> List[Path]:
+    """check_path for many paths at once, in order. Stat calls release the GIL, so they run in threads."""
+    if len(values) < 2:
+        return [check_path(v, check_existence=check_existence) for v in values]
+
+    return list(_FS_EXECUTOR.map(lambda v: check_path(v, check_existence=check_existence), values))
+
 async def validate_path(path_str: str, 
     ctx: fastmcp.Context, 
     must_exist:bool = True, 
@@ -71,29 +176,49 @@ async def validate_path(path_str: str,
     if not await withinAllowed(path, ctx):
         raise ValueError(f"Access denied: Path '{path}' is not within allowed roots.")
     
-    if must_exist and not path.exists():
-        raise ValueError(f"Error: Path '{path}' does not exist")
-    
-    if must_exist and expected_type:
-        if expected_type == 'file' and not path.is_file():
-            raise ValueError(f"Error: Expected file, but '{path.name}' is a directory")
+    if must_exist:
+        # one stat for existence and type instead of exists() + is_file()/is_dir()
+        st = stat_or_none(path)
+        if st is None:
+            raise ValueError(f"Error: Path '{path}' does not exist")
+        
+        if expected_type == 'file' and not stat.S_ISREG(st.st_mode):
+            kind = "a directory" if stat.S_ISDIR(st.st_mode) else "not a regular file"
+            raise ValueError(f"Error: Expected file, but '{path.name}' is {kind}")
         
-        if expected_type == 'dir' and not path.is_dir():
+        if expected_type == 'dir' and not stat.S_ISDIR(st.st_mode):
             raise ValueError(f"Error: Expected directory, but '{path.name}' is a file")
     
     return path
 
+def stat_or_none(path: Path | str) -> Optional[os.stat_result]:
+    """os.stat that returns None where Path.exists() would be False."""
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
 async def fetch_roots_from_client(context: fastmcp.Context) -> Optional[List[Path]]:
-    if checkRootsCapability(context.session):
+    session = context.session
+    if checkRootsCapability(session):
+        cached = _CLIENT_ROOTS_CACHE.get(session)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < settings.CLIENT_ROOTS_TTL:
+            return list(cached[2])
+
         logger.info("Listing roots from client")
         roots = None
         try:
             roots = await context.list_roots()
-            uris: list[Path] = []
             if roots is not None:
-                for root in roots:
-                    file_url = uri_to_path(str(root.uri))
-                    uris.append(file_url)
+                root_uris = tuple(sys.intern(str(root.uri)) for root in roots)
+
+                if cached is not None and cached[1] == root_uris:
+                    _CLIENT_ROOTS_CACHE[session] = (now, root_uris, cached[2])
+                    return list(cached[2])
+
+                uris: list[Path] = [uri_to_path(uri) for uri in root_uris]
+                _CLIENT_ROOTS_CACHE[session] = (now, root_uris, tuple(uris))
                 logger.info(f"Fetched roots from client: {uris}")
                 return uris
             else:
@@ -101,65 +226,95 @@ async def fetch_roots_from_client(context: fastmcp.Context) -> Optional[List[Pat
         except Exception as e:
             logger.error(f"Error fetching roots from client: {e}")
 
+# built once, check_client_capability only reads them
+_ROOTS_CAP = ClientCapabilities(roots=RootsCapability())
+_ELICITATION_CAP = ClientCapabilities(elicitation=ElicitationCapability())
+_SAMPLING_CAP = ClientCapabilities(sampling=SamplingCapability())
+
 def checkRootsCapability(session: ServerSession) -> bool:
-    caps = ClientCapabilities(roots=RootsCapability())
-    return session.check_client_capability(caps)
+    return session.check_client_capability(_ROOTS_CAP)
 
 def checkElicitationCapability(session: ServerSession) -> bool:
-    caps = ClientCapabilities(elicitation=ElicitationCapability())
-    return session.check_client_capability(caps)
+    return session.check_client_capability(_ELICITATION_CAP)
 
 def checkSamplingCapability(session: ServerSession) -> bool:
-    caps = ClientCapabilities(sampling=SamplingCapability())
-    return session.check_client_capability(caps)
+    return session.check_client_capability(_SAMPLING_CAP)
+
+def get_client_features(session: ServerSession) -> dict[str, bool]:
+    """All three capability flags from one read of the negotiated client capabilities."""
+    try:
+        params = session.client_params
+    except AttributeError:
+        # session without negotiated params exposed, ask one by one
+        return {
+            "elicitation": checkElicitationCapability(session),
+            "sampling": checkSamplingCapability(session),
+            "roots": checkRootsCapability(session),
+        }
+
+    caps = params.capabilities if params is not None else None
+    return {
+        "elicitation": caps is not None and caps.elicitation is not None,
+        "sampling": caps is not None and caps.sampling is not None,
+        "roots": caps is not None and caps.roots is not None,
+    }
+
+@lru_cache(maxsize=64)
+def _root_prefixes(roots: tuple[Path, ...]) -> tuple[str, ...]:
+    """Resolve roots once and turn them into sorted 'root + os.sep' strings for prefix checks.
+    Roots nested in another root are dropped, then the only candidate for a path is
+    the nearest prefix before it in sort order (see is_within_roots)."""
+    prefixes = []
+    for root in roots:
+        root_str = os.path.normcase(str(root.resolve()))
+        # "/" (or "C:\\") already ends with separator
+        if not root_str.endswith(os.sep):
+            root_str += os.sep
+        prefixes.append(root_str)
+
+    outermost = []
+    for prefix in sorted(set(prefixes)):
+        # in sort order a nested root comes right after its parent (or after another root nested there)
+        if not (outermost and prefix.startswith(outermost[-1])):
+            outermost.append(prefix)
+    return tuple(outermost)
+
+def is_within_roots(path: Path, roots: List[Path]) -> bool:
+    """Synchronous part of withinAllowed, for checking several paths against roots fetched once."""
+    p = check_path(path, check_existence=False)
+    # trailing separator, so the root itself matches and "/data2" doesn't match "/data"
+    p_str = os.path.normcase(str(p)) + os.sep
+    prefixes = _root_prefixes(tuple(roots))
+    i = bisect_right(prefixes, p_str) - 1
+    return i >= 0 and p_str.startswith(prefixes[i])
 
 async def withinAllowed(path: Path, ctx: fastmcp.Context) -> bool:
     """Check if a given path is within allowed scopes of Global allowed directories on server and roots from client."""
     current_scope= await get_combined_roots(ctx)
-    
-    p = check_path(path, check_existence=False)
-    for root in current_scope:
-        try:
-            # Check if path is within the root
-            p.relative_to(root.resolve())
-            return True
-        except ValueError:
-            continue
-    return False
+    return is_within_roots(path, current_scope)
 
 ## Helper functions------
 def format_timestamp(timestamp: float) -> str:
     """Format timestamp to readable string."""
-    from datetime import datetime
     return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 def format_size(size: int) -> str:
     """Format file size in human readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size < 1024.0:
-            return f"{size:.1f} {unit}"
-        size /= 1024.0
-    return f"{size:.1f} PB"
+    if size < 1024:
+        return f"{size:.1f} B"
+    # every unit is 10 more bits, so the unit comes straight from the bit length
+    unit = min((int(size).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (10 * unit)):.1f} {_SIZE_UNITS[unit]}"
 
 
 
-def should_include_file(file_path: Path, base_path: Path, exclude_patterns: List[str]) -> bool:
-    """Check if file should be included based on exclude patterns."""
-    import fnmatch
-    
-    try:
-        # Get relative path for pattern matching
-        rel_path = file_path.relative_to(base_path)
-        rel_path_str = str(rel_path).replace('\\', '/')
-        
-        for pattern in exclude_patterns:
-            if fnmatch.fnmatch(rel_path_str, pattern):
-                return False
-            # Also check just the filename
-            if fnmatch.fnmatch(file_path.name, pattern):
-                return False
-    except Exception:
-        pass
-    
-    return True
\ No newline at end of file
+def compile_globs(patterns: Optional[List[str]]) -> Optional[re.Pattern]:
+    """Compile fnmatch patterns into one regex (None if there are no patterns)."""
+    if not patterns:
+        return None
+    # fnmatch compares normcase'd strings, i.e. case-insensitive on Windows
+    flags = re.IGNORECASE if os.name == 'nt' else 0
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns), flags)
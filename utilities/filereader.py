@@ -49,15 +49,14 @@ class FileReader:
         result = []
         for file_path in self.file_pathes:
             file_content = self.detector(file_path)
-            size = Path(file_path).stat().st_size
-            mtime = Path(file_path).stat().st_mtime
+            stat = Path(file_path).stat()
             
             result.append({
                 "metadata": {
                     "path": str(file_path),
                     "type": file_path.suffix.lower().lstrip('.'),
-                    "size": size,
-                    "mtime": mtime
+                    "size": stat.st_size,
+                    "mtime": stat.st_mtime
                 },
                 "content": file_content
             })
@@ -391,8 +390,13 @@ class FileReader:
         }
 
     def _read_text(self,file_path:Path):
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            text = f.read()
+        # unbuffered binary read: one read of the whole file, then a single C-level decode
+        # (no text layer with its per-chunk work), newlines translated afterwards like text mode did
+        with open(file_path, 'rb', buffering=0) as f:
+            data = f.read()
+        text = data.decode('utf-8', errors='ignore')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
         return text
     
     def _read_epub(self,file_path:Path):
@@ -1,3 +1,4 @@
+import base64
 import json
 import logging
 import os
@@ -10,7 +11,11 @@ try:
 except ImportError:
     redis = None
 
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 logger = logging.getLogger("fastmcp.storage")
 
@@ -30,17 +35,30 @@ class KeyValueStore(ABC):
         pass
 
 class RedisStore(KeyValueStore):
-    def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0, password: str = None):
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: str = None,
+        max_connections: int = 32,
+        socket_keepalive: bool = True,
+    ):
         if redis is None:
             raise ImportError("Redis library is not installed. Run 'pip install redis'")
-        
-        self.redis = redis.Redis(
-            host=host, 
-            port=port, 
-            db=db, 
-            password=password, 
-            decode_responses=True 
+
+        # one pool per store, so concurrent auth lookups reuse sockets
+        # instead of doing TCP(+AUTH) handshake on every request
+        self.pool = redis.ConnectionPool(
+            host=host,
+            port=port,
+            db=db,
+            password=password,
+            max_connections=max_connections,
+            socket_keepalive=socket_keepalive,
+            decode_responses=True,
         )
+        self.redis = redis.Redis(connection_pool=self.pool)
 
     def _make_key(self, key: str, collection: Optional[str]) -> str:
         return f"{collection}:{key}" if collection else key
@@ -68,6 +86,10 @@ class RedisStore(KeyValueStore):
 class DiskStore(KeyValueStore):
     def __init__(self, file_path: str = "mcp_storage.json"):
         self.file_path = file_path
+        # the store owns its location, callers don't have to create the directory first
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
 
     async def _load(self) -> dict:
         try:
@@ -105,20 +127,50 @@ class DiskStore(KeyValueStore):
             del data[coll][key]
             await self._save(data)
 
-class FernetEncryptionWrapper(KeyValueStore):
-    def __init__(self, store: KeyValueStore, fernet_key: str | bytes):
+class EncryptionWrapper(KeyValueStore):
+    """
+    Base for stores that encrypt values before handing them to the backend.
+    Subclasses only implement _encrypt/_decrypt, json handling is shared.
+    """
+
+    def __init__(self, store: KeyValueStore):
         self.store = store
-        if isinstance(fernet_key, str):
-            fernet_key = fernet_key.encode()
-        self.fernet = Fernet(fernet_key)
 
-    async def get(self, key: str, collection: Optional[str] = None) -> Any:
+    @abstractmethod
+    def _encrypt(self, plaintext: str, aad: bytes) -> str:
+        pass
+
+    @abstractmethod
+    def _decrypt(self, token: str, aad: bytes) -> str:
+        pass
+
+    @staticmethod
+    def _aad(key: str, collection: Optional[str]) -> bytes:
+        # binds ciphertext to its storage slot, so values can't be swapped between keys
+        return f"{collection or 'default'}:{key}".encode()
+
+    @staticmethod
+    def _serialize(value: Any) -> str:
+        if isinstance(value, dict):
+            value = json.dumps(value)
+
+        # Якщо value це число або щось інше, перетворюємо в рядок
+        if not isinstance(value, str):
+            value = str(value)
+        return value
+
+    async def _load_plaintext(self, key: str, collection: Optional[str]) -> Optional[str]:
         encrypted_value = await self.store.get(key, collection=collection)
         if not encrypted_value:
             return None
+        return self._decrypt(encrypted_value, self._aad(key, collection))
+
+    async def get(self, key: str, collection: Optional[str] = None) -> Any:
         try:
-            decrypted = self.fernet.decrypt(encrypted_value.encode()).decode()
-            
+            decrypted = await self._load_plaintext(key, collection)
+            if decrypted is None:
+                return None
+
             try:
                 return json.loads(decrypted)
             except json.JSONDecodeError:
@@ -130,19 +182,82 @@ class FernetEncryptionWrapper(KeyValueStore):
 
     async def put(self, key: str, value: Any, collection: Optional[str] = None, ttl: Optional[int] = None) -> None:
         try:
-            if isinstance(value, dict):
-                value = json.dumps(value)
-            
-            # Якщо value це число або щось інше, перетворюємо в рядок
-            if not isinstance(value, str):
-                 value = str(value)
-
-            encrypted = self.fernet.encrypt(value.encode()).decode()
-            
+            value = self._serialize(value)
+
+            encrypted = self._encrypt(value, self._aad(key, collection))
+
             await self.store.put(key, encrypted, collection=collection, ttl=ttl)
         except Exception as e:
             logger.error(f"Encryption failed for key {key}: {e}")
             raise e
 
     async def delete(self, key: str, collection: Optional[str] = None) -> None:
-        await self.store.delete(key, collection=collection)
\ No newline at end of file
+        await self.store.delete(key, collection=collection)
+
+
+class FernetEncryptionWrapper(EncryptionWrapper):
+    """AES-128-CBC + HMAC-SHA256. Kept for stores written before AES-GCM and for key rotation."""
+
+    def __init__(self, store: KeyValueStore, fernet_key: str | bytes):
+        if isinstance(fernet_key, str):
+            fernet_key = fernet_key.encode()
+        super().__init__(store)
+        self.fernet = Fernet(fernet_key)
+
+    def _encrypt(self, plaintext: str, aad: bytes) -> str:
+        # fernet has no associated data, aad is ignored
+        return self.fernet.encrypt(plaintext.encode()).decode()
+
+    def _decrypt(self, token: str, aad: bytes) -> str:
+        return self.fernet.decrypt(token.encode()).decode()
+
+
+class AESGCMEncryptionWrapper(EncryptionWrapper):
+    """
+    AES-256-GCM (AEAD, uses AES-NI/CLMUL where available).
+    Stored value is base64(nonce(12 bytes) + ciphertext + tag), aad is the storage key name.
+    Values written by FernetEncryptionWrapper with the same key are still read,
+    they are re-encrypted with AES-GCM on their next write.
+    """
+    NONCE_SIZE = 12
+    # the AES key is derived from the configured key, the raw key itself is only used by Fernet
+    KEY_INFO = b"filesystem-mcp-server storage aes-256-gcm"
+
+    def __init__(self, store: KeyValueStore, key: str | bytes):
+        raw_key = decode_encryption_key(key)
+        if len(raw_key) != 32:
+            raise ValueError("AES-GCM storage key must be 32 bytes (urlsafe base64 encoded)")
+        super().__init__(store)
+        self.aesgcm = AESGCM(derive_key(raw_key, self.KEY_INFO))
+        # keys_gen.py keys are Fernet keys as well, stores from older versions are encrypted with them
+        self.legacy = Fernet(base64.urlsafe_b64encode(raw_key))
+
+    def _encrypt(self, plaintext: str, aad: bytes) -> str:
+        nonce = os.urandom(self.NONCE_SIZE)
+        ciphertext = self.aesgcm.encrypt(nonce, plaintext.encode(), aad)
+        # backends store strings (json on disk, decoded responses in redis), so base64 is still needed
+        return base64.urlsafe_b64encode(nonce + ciphertext).decode()
+
+    def _decrypt(self, token: str, aad: bytes) -> str:
+        try:
+            data = base64.urlsafe_b64decode(token.encode())
+            nonce, ciphertext = data[:self.NONCE_SIZE], data[self.NONCE_SIZE:]
+            return self.aesgcm.decrypt(nonce, ciphertext, aad).decode()
+        except (InvalidTag, ValueError):
+            # not an AES-GCM value (or tampered with), try the old Fernet format, raises InvalidToken if it's not that either
+            return self.legacy.decrypt(token.encode()).decode()
+
+
+def derive_key(raw_key: bytes, info: bytes) -> bytes:
+    """32-byte subkey of raw_key for one purpose (HKDF-SHA256), so one configured key isn't reused across ciphers."""
+    return HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=info).derive(raw_key)
+
+
+def decode_encryption_key(key: str | bytes) -> bytes:
+    """Decode urlsafe base64 key (same format keys_gen.py produces)."""
+    if isinstance(key, str):
+        key = key.encode()
+    try:
+        return base64.urlsafe_b64decode(key)
+    except (ValueError, TypeError):
+        return b""